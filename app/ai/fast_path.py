@@ -0,0 +1,187 @@
+"""
+Deterministic pre-router in front of app_graph.
+
+Messages that are fully structured ("rooms from 2026-12-20 to 2026-12-23",
+"occupancy today", "who booked room 101?") are answered by calling the tool
+directly and filling a template, skipping both LLM round trips. Patterns are
+anchored on the whole message, so anything with extra wording falls through
+to the LLM.
+
+The reply is recorded as a normal tool-call exchange (AIMessage with
+tool_calls -> ToolMessage -> AIMessage), so later LLM turns see it in the
+history like any other tool use.
+"""
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from app.ai.roles import ROLE_SPECS, DEFAULT_ROLE
+from app.ai.tools.availability import check_availability_tool
+from app.ai.tools.guest_info import get_guest_info_tool
+from app.ai.tools.reporting import get_booking_details_tool
+from app.ai.tools.stats import hotel_stats_tool
+
+ISO_DATE = r"\d{4}-\d{2}-\d{2}"
+DATE = rf"({ISO_DATE})"
+EMAIL = r"([\w.+-]+@[\w-]+(?:\.[\w-]+)+)"
+ROOM = r"(\d{1,5})"
+_END = r"\s*[?.!]*\s*$"
+
+
+@dataclass
+class Intent:
+    name: str
+    tool: object
+    pattern: re.Pattern
+    args: Callable[[re.Match], dict]
+    reply: Callable[[dict, str], str]
+
+
+def _stats_args(m: re.Match) -> dict:
+    day = (m.group(1) or "today").lower()
+    if day == "today":
+        return {}  # the stats tool defaults to today
+    if day == "tomorrow":
+        return {"date": (datetime.now().date() + timedelta(days=1)).isoformat()}
+    return {"date": day}
+
+
+def _availability_reply(args: dict, result: str) -> str:
+    if result.startswith("Error") or result.startswith("No rooms"):
+        return result
+    return (f"Here is what we have from **{args['start_date']}** to **{args['end_date']}**:\n\n"
+            f"{result}\n\nWould you like me to reserve one of these rooms?")
+
+
+INTENTS = [
+    Intent(
+        "availability",
+        check_availability_tool,
+        re.compile(
+            r"^\s*(?:(?:are there|any|show(?: me)?|check|list)\s+)?(?:free\s+|available\s+)?"
+            r"(?:rooms?|availability|vacancy|vacancies)\s+(?:available\s+|free\s+)?"
+            rf"(?:from|between|for)\s+{DATE}\s+(?:to|and|until|till|-)\s+{DATE}{_END}",
+            re.IGNORECASE,
+        ),
+        lambda m: {"start_date": m.group(1), "end_date": m.group(2)},
+        _availability_reply,
+    ),
+    Intent(
+        "stats",
+        hotel_stats_tool,
+        re.compile(
+            r"^\s*(?:show(?: me)?\s+)?(?:the\s+)?(?:occupancy|revenue|status report|daily report|hotel stats)"
+            rf"(?:\s+(?:for\s+|on\s+)?(today|tomorrow|{ISO_DATE}))?{_END}",
+            re.IGNORECASE,
+        ),
+        _stats_args,
+        lambda args, result: result,
+    ),
+    Intent(
+        "room_schedule",
+        get_booking_details_tool,
+        re.compile(
+            rf"^\s*(?:who booked|who is in|bookings for|schedule for|show bookings for)\s+room\s+{ROOM}{_END}",
+            re.IGNORECASE,
+        ),
+        lambda m: {"room_number": m.group(1)},
+        lambda args, result: result,
+    ),
+    Intent(
+        "all_bookings",
+        get_booking_details_tool,
+        re.compile(r"^\s*(?:show(?: me)?\s+|list\s+)?all\s+(?:active\s+|upcoming\s+)?bookings" + _END, re.IGNORECASE),
+        lambda m: {},
+        lambda args, result: result,
+    ),
+    Intent(
+        "guest_lookup",
+        get_guest_info_tool,
+        re.compile(rf"^\s*(?:guest info(?: for)?|look ?up|find guest|who is)\s+{EMAIL}{_END}", re.IGNORECASE),
+        lambda m: {"email": m.group(1)},
+        lambda args, result: result,
+    ),
+]
+
+
+def match_intent(message: str, role: str):
+    """Returns (intent, tool args) for a high-confidence match the role may run, else None."""
+    spec = ROLE_SPECS.get(role) or ROLE_SPECS[DEFAULT_ROLE]
+    allowed = {t.name for t in spec.tools}
+    for intent in INTENTS:
+        if intent.tool.name not in allowed:
+            continue
+        m = intent.pattern.match(message)
+        if m:
+            return intent, intent.args(m)
+    return None
+
+
+class FastPathStats:
+    """Fast-path hits per intent vs. LLM runs, with their average latencies."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = {}
+        self.fast_seconds = 0.0
+        self.llm_runs = 0
+        self.llm_seconds = 0.0
+
+    def record_hit(self, intent: str, seconds: float):
+        with self._lock:
+            self.hits[intent] = self.hits.get(intent, 0) + 1
+            self.fast_seconds += seconds
+
+    def record_llm(self, seconds: float):
+        with self._lock:
+            self.llm_runs += 1
+            self.llm_seconds += seconds
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = sum(self.hits.values())
+            total = hits + self.llm_runs
+            avg_fast = self.fast_seconds / hits if hits else 0.0
+            avg_llm = self.llm_seconds / self.llm_runs if self.llm_runs else 0.0
+            return {
+                "fast_path_hits": hits,
+                "llm_runs": self.llm_runs,
+                "fast_path_rate": round(hits / total, 4) if total else 0.0,
+                "hits_by_intent": dict(self.hits),
+                "avg_fast_path_ms": round(avg_fast * 1000, 2),
+                "avg_llm_ms": round(avg_llm * 1000, 2),
+                # What the fast-pathed messages would have cost at the average LLM latency
+                "estimated_seconds_saved": round(hits * max(avg_llm - avg_fast, 0.0), 3),
+            }
+
+
+fast_path_stats = FastPathStats()
+
+
+async def try_fast_path(message: str, role: str) -> Optional[List[BaseMessage]]:
+    """
+    Answers `message` without the LLM when it matches an intent.
+    Returns the messages to append to the history (tool call, tool result,
+    reply), or None to fall through to app_graph.
+    """
+    found = match_intent(message, role)
+    if found is None:
+        return None
+    intent, args = found
+
+    started = time.perf_counter()
+    call_id = f"fast_{uuid.uuid4().hex[:12]}"
+    result = str(await intent.tool.ainvoke(args))
+    messages = [
+        AIMessage(content="", tool_calls=[{"name": intent.tool.name, "args": args, "id": call_id}]),
+        ToolMessage(content=result, tool_call_id=call_id, name=intent.tool.name),
+        AIMessage(content=intent.reply(args, result)),
+    ]
+    fast_path_stats.record_hit(intent.name, time.perf_counter() - started)
+    return messages
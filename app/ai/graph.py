@@ -1,34 +1,63 @@
 import operator
+import time
 import traceback
 from typing import TypedDict, Annotated, List
 
-from langchain_groq import ChatGroq
 from langchain_core.messages import SystemMessage, AIMessage, BaseMessage, ToolMessage
 from langgraph.graph import StateGraph
-from langgraph.prebuilt import ToolNode, tools_condition
+from langgraph.prebuilt import tools_condition
 
 from app.core.config import settings
+from app.core import metrics
+from app.ai.roles import ROLE_SPECS, DEFAULT_ROLE, build_role_profiles, registered_tools
+from app.ai.history import count_tokens, estimate_tokens
+from app.ai.llm import build_llm
+from app.ai.tool_executor import build_tool_node
 
-# --- IMPORT TOOLS ---
-from app.ai.tools.availability import check_availability_tool
-from app.ai.tools.booking import book_room_tool
-from app.ai.tools.guest_info import get_guest_info_tool
-from app.ai.tools.stats import hotel_stats_tool
-from app.ai.tools.reporting import get_booking_details_tool
 # ============================================================
-# 1. DEFINE TOOLKITS
+# 1. DEFINE TOOLKITS (per role, see app/ai/roles.py)
 # ============================================================
-guest_tools = [check_availability_tool, book_room_tool]
-manager_tools = [hotel_stats_tool, get_guest_info_tool, check_availability_tool, get_booking_details_tool]
-all_tools = [check_availability_tool, book_room_tool, get_guest_info_tool, hotel_stats_tool, get_booking_details_tool]
+guest_tools = list(ROLE_SPECS["guest"].tools)
+manager_tools = list(ROLE_SPECS["manager"].tools)
+all_tools = registered_tools()
 # ============================================================
 # 2. SETUP LLM
 # ============================================================
-llm = ChatGroq(
-    model_name="llama-3.3-70B-Versatile",
-    temperature=0,
-    api_key=settings.GROQ_API_KEY
-)
+# Provider comes from settings.LLM_PROVIDER (see app/ai/llm.py)
+llm = build_llm()
+
+# Tool-bound runnables + SystemMessages, built once instead of on every turn
+role_profiles = build_role_profiles(llm)
+
+
+def set_llm(new_llm):
+    """Swaps the chat model (e.g. a fake one in benchmarks) and rebinds every role."""
+    global llm, role_profiles
+    llm = new_llm
+    role_profiles = build_role_profiles(new_llm)
+
+
+# Keep last 30 messages when HISTORY_COMPACTION_ENABLED is off
+MAX_HISTORY_MESSAGES = 30
+
+
+def recent_history(messages: List[BaseMessage], limit: int = MAX_HISTORY_MESSAGES) -> List[BaseMessage]:
+    """The last `limit` non-system messages, walking back from the end instead of copying the whole list."""
+    history = []
+    for m in reversed(messages):
+        if isinstance(m, SystemMessage):
+            continue
+        history.append(m)
+        if len(history) == limit:
+            break
+    history.reverse()
+    return history
+
+def record_token_usage(prompt: List[BaseMessage], response: AIMessage):
+    """Provider-reported token usage when there is one (Groq), else the ~4 chars/token estimate."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    metrics.LLM_TOKENS.labels("prompt").observe(usage.get("input_tokens") or count_tokens(prompt))
+    metrics.LLM_TOKENS.labels("completion").observe(usage.get("output_tokens") or estimate_tokens(response))
 
 # ============================================================
 # 3. DEFINE STATE
@@ -40,61 +69,28 @@ class AgentState(TypedDict):
 # ============================================================
 # 4. THE BRAIN (CHATBOT NODE)
 # ============================================================
-def chatbot_node(state: AgentState):
+async def chatbot_node(state: AgentState):
     try:
         messages = state.get("messages", [])
-        role = state.get("user_role", "guest")
-
-        if role == "manager":
-            tools_subset = manager_tools
-            system_prompt = (
-                "You are the **Grand Hotel Executive Assistant**.\n"
-                "**PROTOCOL:**\n"
-                "1. If asked for a 'Daily Report', 'Revenue', or 'Occupancy', run `hotel_stats_tool`.\n"
-                "2. If asked 'Who booked Room X?', 'Show me all bookings', or 'Check-ins today', run `get_booking_details_tool`.\n"
-                "3. If asked about a specific guest (by name/email), run `get_guest_info_tool`.\n"
-                "4. If asked about room availability, run `check_availability_tool`.\n"
-                "**REPORTING STYLE:**\n"
-                "- Output the exact data from the tools.\n"
-                "- Do NOT hide any booking details provided by the tool.\n"
-                "- Do NOT say 'availability may change'. Just state the facts.\n"
-                "**STRICT:** Do not book rooms yourself. You are an analyst."
-            )
+        role = state.get("user_role", DEFAULT_ROLE)
+
+        profile = role_profiles.get(role) or role_profiles[DEFAULT_ROLE]
+
+        if settings.HISTORY_COMPACTION_ENABLED:
+            # Already compacted once per turn by the session store: [summary] + recent turns + this turn
+            history = messages
         else:
-            # 🛎️ GUEST PERSONA - REINFORCED TRIGGER
-            tools_subset = guest_tools
-            system_prompt = (
-                "You are the **Grand Hotel Concierge**. Warm, professional, and precise.\n\n"
-                "**GOAL:** Help the user book a room. Follow these steps strictly:\n"
-                "1. **Inquiry:** Confirm features and ask for check-in/out dates.\n"
-                "2. **Check:** Use `check_availability_tool` ONLY when you have valid dates.\n"
-                "   **IMPORTANT:** Always convert dates to 'YYYY-MM-DD' format before calling tools (e.g. '2025-12-30').\n"  # <--- ADD THIS LINE
-                "3. **Offer:** Present available rooms clearly.\n"
-                "4. When you get the check in and check out dates, list the available rooms in tabular format.\n"
-                "4. **Pre-Confirmation:** Once a user picks a room, summarize: Room, Dates, and Guest count.\n"
-                "   Ask: 'Shall I proceed with opening the reservation form for you?'\n"
-                "5. **Trigger:** ONLY if the user gives a positive confirmation (e.g., 'Yes', 'Proceed'), "
-                "reply with the exact phrase: 'I am opening the reservation form now. <SHOW_BOOKING_FORM>'\n\n"
-                "**🚨 CRITICAL RULES:**\n"
-                "- **NO HIDDEN FORMS:** Do not use <SHOW_BOOKING_FORM> until the user says YES to your summary.\n"
-                "- **SYSTEM ALERTS:** If you see a 'SYSTEM ALERT' confirming a booking, stop the sales process. "
-                "Welcome them to the hotel and ask if they need anything else.\n"
-                "- **VOICE:** Be professional. Never say 'I will use a tool'."
-            )
-
-        llm_with_specific_tools = llm.bind_tools(tools_subset)
-        sys_msg = SystemMessage(content=system_prompt)
-
-        # Keep last 30 messages for memory stability
-        history = [m for m in messages if not isinstance(m, SystemMessage)]
-        if len(history) > 30:
-            history = history[-30:]
-
-        full_conversation = [sys_msg] + history
-        response = llm_with_specific_tools.invoke(full_conversation)
+            history = recent_history(messages)
+
+        full_conversation = [profile.system_message] + history
+        started = time.perf_counter()
+        response = await profile.runnable.ainvoke(full_conversation)
+        metrics.LLM_CALL_SECONDS.labels(profile.spec.name).observe(time.perf_counter() - started)
+        record_token_usage(full_conversation, response)
         return {"messages": [response]}
 
     except Exception as e:
+        metrics.LLM_ERRORS.labels(state.get("user_role", DEFAULT_ROLE)).inc()
         traceback.print_exc()
         return {
             "messages": [AIMessage(content="I'm having trouble connecting to the concierge desk. Please try again.")],
@@ -105,7 +101,9 @@ def chatbot_node(state: AgentState):
 # ============================================================
 workflow = StateGraph(AgentState)
 workflow.add_node("agent", chatbot_node)
-workflow.add_node("tools", ToolNode(all_tools))
+# Several tool calls in one message run in parallel (bounded pool + per-tool timeout)
+tool_node = build_tool_node(all_tools)
+workflow.add_node("tools", tool_node)
 workflow.set_entry_point("agent")
 workflow.add_conditional_edges("agent", tools_condition)
 workflow.add_edge("tools", "agent")
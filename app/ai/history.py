@@ -0,0 +1,188 @@
+"""
+Token-budgeted chat history.
+
+Recent turns go to the model verbatim. Older turns are folded into a short
+running summary (a SystemMessage carried at the front of the stored
+history), and big tool outputs in earlier turns are cut down to a preview.
+A "turn" runs from one HumanMessage to the next, so an AIMessage with
+tool_calls always travels with its ToolMessages.
+
+Compaction runs once per turn, when the session store saves the history:
+the stored copy is already the prompt prefix of the next turn, so the agent
+node sends it as is on every model call of that turn.
+
+Token counts are a ~4 chars/token estimate: close enough to budget with,
+and free to compute.
+"""
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from app.core.config import settings
+from app.core import metrics
+
+SUMMARY_MARKER = "history_summary"
+SUMMARY_HEADER = "Summary of the earlier conversation (older turns, condensed):"
+CHARS_PER_TOKEN = 4
+TOKENS_PER_MESSAGE = 3
+
+
+def estimate_tokens(message: BaseMessage) -> int:
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    chars = len(content)
+    if isinstance(message, AIMessage):
+        for call in message.tool_calls:
+            chars += len(call.get("name", "")) + len(str(call.get("args", "")))
+    return chars // CHARS_PER_TOKEN + TOKENS_PER_MESSAGE
+
+
+def count_tokens(messages: List[BaseMessage]) -> int:
+    return sum(estimate_tokens(m) for m in messages)
+
+
+def is_summary(message: BaseMessage) -> bool:
+    return isinstance(message, SystemMessage) and message.additional_kwargs.get(SUMMARY_MARKER, False)
+
+
+def split_turns(messages: List[BaseMessage]) -> List[List[BaseMessage]]:
+    """Groups messages into turns, each starting at a HumanMessage (leading orphans form their own turn)."""
+    turns: List[List[BaseMessage]] = []
+    for m in messages:
+        if isinstance(m, HumanMessage) or not turns:
+            turns.append([m])
+        else:
+            turns[-1].append(m)
+    return turns
+
+
+def _clip(text, limit: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def summarize_turn(turn: List[BaseMessage]) -> str:
+    """One deterministic line per turn: the question, the tools used and the answer, each clipped."""
+    parts = []
+    for m in turn:
+        if isinstance(m, HumanMessage):
+            parts.append(f"User: {_clip(m.content, 160)}")
+        elif isinstance(m, ToolMessage):
+            parts.append(f"[{m.name or 'tool'} → {_clip(m.content, 120)}]")
+        elif isinstance(m, AIMessage) and m.content:
+            parts.append(f"Assistant: {_clip(m.content, 160)}")
+    return "- " + " | ".join(parts) if parts else ""
+
+
+def shrink_tool_output(message: ToolMessage, max_tokens: int) -> ToolMessage:
+    """Keeps the head of a large tool result; same tool_call_id, so the pair stays valid."""
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(content) <= limit:
+        return message
+    head = content[:limit]
+    cut = head.rfind("\n")
+    if cut > limit // 2:
+        head = head[:cut]
+    note = f"\n[... {len(content) - len(head)} more characters omitted; run the tool again for the full output]"
+    return message.model_copy(update={"content": head + note})
+
+
+@dataclass
+class Compaction:
+    messages: List[BaseMessage]  # [summary?] + verbatim recent turns
+    tokens_before: int
+    tokens_after: int
+    folded_turns: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(self.tokens_before - self.tokens_after, 0)
+
+
+class HistoryManager:
+    """Fits a conversation into `token_budget`, newest turns first, older ones summarized."""
+
+    def __init__(self, token_budget: int, tool_output_max_tokens: int, summary_max_tokens: int):
+        self.token_budget = token_budget
+        self.tool_output_max_tokens = tool_output_max_tokens
+        self.summary_max_tokens = summary_max_tokens
+        self._lock = threading.Lock()
+        self.turns = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+
+    def _summary_message(self, previous: Optional[str], folded: List[List[BaseMessage]]) -> Optional[SystemMessage]:
+        lines = previous.splitlines()[1:] if previous else []
+        lines += [line for line in (summarize_turn(t) for t in folded) if line]
+        if not lines:
+            return None
+        # Rolling: the oldest lines go first once the summary outgrows its own budget
+        while len(lines) > 1 and (sum(len(l) for l in lines) // CHARS_PER_TOKEN) > self.summary_max_tokens:
+            lines.pop(0)
+        return SystemMessage(content="\n".join([SUMMARY_HEADER] + lines), additional_kwargs={SUMMARY_MARKER: True})
+
+    def compact(self, messages: List[BaseMessage], max_messages: Optional[int] = None) -> Compaction:
+        """
+        Returns the messages to send (or store): the running summary, then as
+        many whole recent turns as fit the budget. The newest turn is always
+        kept verbatim. `max_messages` additionally caps the verbatim part.
+        """
+        previous = None
+        conversation = []
+        for m in messages:
+            if is_summary(m):
+                previous = m.content
+            elif not isinstance(m, SystemMessage):
+                conversation.append(m)
+        tokens_before = count_tokens(conversation) + (len(previous) // CHARS_PER_TOKEN if previous else 0)
+
+        turns = split_turns(conversation)
+        # Earlier turns never need a tool's full output again
+        turns = [
+            [shrink_tool_output(m, self.tool_output_max_tokens) if isinstance(m, ToolMessage) else m for m in t]
+            for t in turns[:-1]
+        ] + turns[-1:]
+
+        kept: List[List[BaseMessage]] = []
+        used = 0
+        count = 0
+        for turn in reversed(turns):
+            cost = count_tokens(turn)
+            fits = used + cost <= self.token_budget and (max_messages is None or count + len(turn) <= max_messages)
+            if kept and not fits:
+                break
+            kept.append(turn)
+            used += cost
+            count += len(turn)
+        kept.reverse()
+
+        folded = turns[: len(turns) - len(kept)]
+        summary = self._summary_message(previous, folded)
+        out = ([summary] if summary else []) + [m for t in kept for m in t]
+        tokens_after = used + (estimate_tokens(summary) if summary else 0)
+        return Compaction(out, tokens_before, tokens_after, len(folded))
+
+    def record(self, compaction: Compaction):
+        with self._lock:
+            self.turns += 1
+            self.tokens_before += compaction.tokens_before
+            self.tokens_after += compaction.tokens_after
+        metrics.HISTORY_TOKENS_SAVED.inc(compaction.tokens_saved)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "turns": self.turns,
+                "prompt_tokens_before": self.tokens_before,
+                "prompt_tokens_after": self.tokens_after,
+                "prompt_tokens_saved": self.tokens_before - self.tokens_after,
+            }
+
+
+history_manager = HistoryManager(
+    token_budget=settings.HISTORY_TOKEN_BUDGET,
+    tool_output_max_tokens=settings.HISTORY_TOOL_OUTPUT_MAX_TOKENS,
+    summary_max_tokens=settings.HISTORY_SUMMARY_MAX_TOKENS,
+)
@@ -0,0 +1,178 @@
+"""
+Chat model provider, picked by `settings.LLM_PROVIDER`.
+
+- "groq": ChatGroq (needs GROQ_API_KEY; langchain_groq is only imported here).
+- "fake": ScriptedChatModel, a local deterministic model with no network.
+  It answers from simple rules (or a fixed script), emits real tool calls,
+  and paces itself by FAKE_LLM_LATENCY_SECONDS and FAKE_LLM_TOKENS_PER_SECOND,
+  so the graph, tools and DB can be profiled and load-tested offline.
+"""
+import asyncio
+import json
+import re
+import time
+import uuid
+from typing import Any, Dict, Iterator, AsyncIterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from app.core.config import settings
+
+_DATES = re.compile(r"\d{4}-\d{2}-\d{2}")
+_ROOM = re.compile(r"\broom\s+(\d{1,5})\b", re.IGNORECASE)
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Offline stand-in for the Groq model.
+
+    Without a `script`, it reads the last human message and calls the first
+    bound tool whose rule matches (two dates -> availability/analytics,
+    "room N" -> booking details, an email -> guest info, report words ->
+    stats); after a tool result it replies with that result. With a
+    `script`, it plays the entries in order (a string is a reply, a dict
+    {"tool": name, "args": {...}} is a tool call), cycling at the end.
+    """
+
+    latency_seconds: float = 0.0  # before the first token
+    tokens_per_second: float = 0.0  # 0 = the whole reply at once
+    script: Optional[List[Any]] = None
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        # Same schema formatting as ChatGroq.bind_tools, so binding costs the same
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    # ---------- deciding what to say ----------
+    def _decide(self, messages: List[BaseMessage], tools: List[dict]) -> AIMessage:
+        self.calls += 1
+        if self.script:
+            return self._from_script(self.script[(self.calls - 1) % len(self.script)])
+
+        last = messages[-1] if messages else None
+        if isinstance(last, ToolMessage):
+            return AIMessage(content=f"Here is what I found:\n{last.content}")
+
+        text = next((m.content for m in reversed(messages) if isinstance(m, HumanMessage)), "")
+        names = {t["function"]["name"] for t in tools}
+        dates = _DATES.findall(text)
+        lowered = text.lower()
+
+        if len(dates) >= 2 and "hotel_analytics_tool" in names and any(
+                w in lowered for w in ("analytics", "adr", "revpar", "revenue", "occupancy")):
+            return self._tool_call("hotel_analytics_tool", {"start_date": dates[0], "end_date": dates[1]})
+        if len(dates) >= 2 and "check_availability_tool" in names:
+            return self._tool_call("check_availability_tool", {"start_date": dates[0], "end_date": dates[1]})
+        email = _EMAIL.search(text)
+        if email and "get_guest_info_tool" in names:
+            return self._tool_call("get_guest_info_tool", {"email": email.group(0)})
+        room = _ROOM.search(text)
+        if room and "get_booking_details_tool" in names:
+            return self._tool_call("get_booking_details_tool", {"room_number": room.group(1)})
+        if "hotel_stats_tool" in names and any(w in lowered for w in ("report", "occupancy", "revenue", "status")):
+            return self._tool_call("hotel_stats_tool", {"date": dates[0]} if dates else {})
+        if "get_booking_details_tool" in names and "bookings" in lowered:
+            return self._tool_call("get_booking_details_tool", {})
+        return AIMessage(content="Certainly! Could you share your check-in and check-out dates (YYYY-MM-DD)?")
+
+    def _from_script(self, entry) -> AIMessage:
+        if isinstance(entry, dict) and "tool" in entry:
+            return self._tool_call(entry["tool"], entry.get("args", {}))
+        return AIMessage(content=str(entry))
+
+    @staticmethod
+    def _tool_call(name: str, args: Dict) -> AIMessage:
+        return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": f"call_{uuid.uuid4().hex[:12]}"}])
+
+    @staticmethod
+    def _words(text: str) -> List[str]:
+        # ~1 token per word (with its trailing space), good enough for pacing
+        return re.findall(r"\S+\s*|\s+", text)
+
+    # ---------- BaseChatModel hooks ----------
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        reply = self._decide(messages, kwargs.get("tools", []))
+        time.sleep(self.latency_seconds + self._emit_seconds(reply))
+        return ChatResult(generations=[ChatGeneration(message=reply)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        reply = self._decide(messages, kwargs.get("tools", []))
+        await asyncio.sleep(self.latency_seconds + self._emit_seconds(reply))
+        return ChatResult(generations=[ChatGeneration(message=reply)])
+
+    def _emit_seconds(self, reply: AIMessage) -> float:
+        if not self.tokens_per_second:
+            return 0.0
+        return len(self._words(reply.content)) / self.tokens_per_second
+
+    def _chunks(self, reply: AIMessage) -> Iterator[AIMessageChunk]:
+        for word in self._words(reply.content):
+            yield AIMessageChunk(content=word)
+        for i, call in enumerate(reply.tool_calls):
+            yield AIMessageChunk(content="", tool_call_chunks=[
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+            ])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        reply = self._decide(messages, kwargs.get("tools", []))
+        time.sleep(self.latency_seconds)
+        for chunk in self._chunks(reply):
+            if self.tokens_per_second and chunk.content:
+                time.sleep(1 / self.tokens_per_second)
+            if run_manager and chunk.content:
+                run_manager.on_llm_new_token(chunk.content, chunk=ChatGenerationChunk(message=chunk))
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        reply = self._decide(messages, kwargs.get("tools", []))
+        await asyncio.sleep(self.latency_seconds)
+        for chunk in self._chunks(reply):
+            if self.tokens_per_second and chunk.content:
+                await asyncio.sleep(1 / self.tokens_per_second)
+            if run_manager and chunk.content:
+                await run_manager.on_llm_new_token(chunk.content, chunk=ChatGenerationChunk(message=chunk))
+            yield ChatGenerationChunk(message=chunk)
+
+
+# ============================================================
+# PROVIDERS
+# ============================================================
+def _groq():
+    if not settings.GROQ_API_KEY:
+        raise ValueError("LLM_PROVIDER=groq needs GROQ_API_KEY (or set LLM_PROVIDER=fake to run offline).")
+    from langchain_groq import ChatGroq  # only needed for this provider
+
+    return ChatGroq(
+        model_name=settings.GROQ_MODEL,
+        temperature=0,
+        api_key=settings.GROQ_API_KEY
+    )
+
+
+def _fake():
+    return ScriptedChatModel(
+        latency_seconds=settings.FAKE_LLM_LATENCY_SECONDS,
+        tokens_per_second=settings.FAKE_LLM_TOKENS_PER_SECOND,
+    )
+
+
+PROVIDERS = {
+    "groq": _groq,
+    "fake": _fake,
+}
+
+
+def build_llm(provider: Optional[str] = None) -> BaseChatModel:
+    name = (provider or settings.LLM_PROVIDER).lower()
+    factory = PROVIDERS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown LLM_PROVIDER '{name}'. Options: {', '.join(PROVIDERS)}")
+    return factory()
@@ -0,0 +1,110 @@
+"""
+Cache of final chat answers for roles that ask the same questions all shift
+("status report", "show all bookings").
+
+Keys are (role, normalized prompt, today's date, bookings data version).
+Every committed booking bumps the version, so answers computed against older
+data are never served again; the date part retires "today" answers at
+midnight, and the TTL bounds staleness from bookings made by other workers.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from app.core.config import settings
+from app.services.data_version import bookings_version
+
+# Follow-ups lean on earlier turns ("and room 102?", "what about them"), so the prompt alone isn't the question
+_CONTEXT_DEPENDENT = re.compile(
+    r"^(and|also|what about|how about|same|then)\b|\b(it|its|that|those|them|he|she|his|her|they|their)\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_prompt(prompt: str) -> str:
+    text = " ".join(prompt.lower().split())
+    return text.rstrip(" ?!.")
+
+
+def is_self_contained(prompt: str) -> bool:
+    return not _CONTEXT_DEPENDENT.search(prompt)
+
+
+def cacheable_answer(new_messages: List[BaseMessage]) -> Optional[str]:
+    """The reply text if this run was a clean, data-backed answer (a tool ran, no errors), else None."""
+    if not new_messages or not isinstance(new_messages[-1], AIMessage):
+        return None
+    reply = new_messages[-1]
+    if reply.tool_calls or not reply.content:
+        return None
+    results = [m for m in new_messages if isinstance(m, ToolMessage)]
+    if not results or any(str(m.content).startswith("Error") for m in results):
+        return None
+    return reply.content
+
+
+class ResponseCache:
+    def __init__(self, roles, max_entries: int, ttl_seconds: float):
+        self.roles = {r.strip() for r in roles if r.strip()}
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (stored_at, answer)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, role: str, prompt: str, version: Optional[int] = None):
+        """None when this question shouldn't be cached (role not cached, or a context-dependent follow-up)."""
+        if role not in self.roles or not is_self_contained(prompt):
+            return None
+        if version is None:
+            version = bookings_version.current
+        return role, normalize_prompt(prompt), datetime.now().date(), version
+
+    def get(self, key) -> Optional[str]:
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, answer: str):
+        """`key` must be taken before the run started, so a booking made meanwhile leaves it unreachable."""
+        if key is None or answer is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), answer)
+            self._entries.move_to_end(key)
+            # Entries from older data versions can never hit again; drop them with the LRU overflow
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "data_version": bookings_version.current,
+            }
+
+
+response_cache = ResponseCache(
+    roles=settings.RESPONSE_CACHE_ROLES.split(","),
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
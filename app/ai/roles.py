@@ -0,0 +1,118 @@
+"""
+Role registry: which tools and which system prompt each chat role gets.
+
+Everything that doesn't change between turns is built once per LLM:
+the tool-bound runnable (tool JSON schemas) and the SystemMessage.
+
+To add a role (e.g. housekeeping or front desk), call `register_role` with
+its prompt and toolkit; the chat graph and its tool node pick it up on the next
+`build_role_profiles`.
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+
+from langchain_core.messages import SystemMessage
+
+# --- IMPORT TOOLS ---
+from app.ai.tools.availability import check_availability_tool
+from app.ai.tools.booking import book_room_tool
+from app.ai.tools.guest_info import get_guest_info_tool
+from app.ai.tools.stats import hotel_stats_tool
+from app.ai.tools.reporting import get_booking_details_tool
+from app.ai.tools.analytics import hotel_analytics_tool
+
+DEFAULT_ROLE = "guest"
+
+
+@dataclass(frozen=True)
+class RoleSpec:
+    """What a role is allowed to do (the static definition)."""
+    name: str
+    system_prompt: str
+    tools: tuple
+
+
+@dataclass(frozen=True)
+class RoleProfile:
+    """A RoleSpec bound to a concrete LLM, ready to invoke."""
+    spec: RoleSpec
+    system_message: SystemMessage
+    runnable: object  # llm.bind_tools(spec.tools)
+
+
+ROLE_SPECS: Dict[str, RoleSpec] = {}
+
+
+def register_role(name: str, system_prompt: str, tools: List) -> RoleSpec:
+    spec = RoleSpec(name=name, system_prompt=system_prompt, tools=tuple(tools))
+    ROLE_SPECS[name] = spec
+    return spec
+
+
+def registered_tools() -> List:
+    """Every tool of every role, once each (what the graph's tool node needs to execute)."""
+    seen = {}
+    for spec in ROLE_SPECS.values():
+        for t in spec.tools:
+            seen.setdefault(t.name, t)
+    return list(seen.values())
+
+
+def build_role_profiles(llm) -> Dict[str, RoleProfile]:
+    """Binds every registered role's toolkit to `llm` (done once, not per turn)."""
+    return {
+        name: RoleProfile(
+            spec=spec,
+            system_message=SystemMessage(content=spec.system_prompt),
+            runnable=llm.bind_tools(list(spec.tools)),
+        )
+        for name, spec in ROLE_SPECS.items()
+    }
+
+
+# ============================================================
+# ROLES
+# ============================================================
+register_role(
+    "manager",
+    (
+        "You are the **Grand Hotel Executive Assistant**.\n"
+        "**PROTOCOL:**\n"
+        "1. If asked for a 'Daily Report', 'Revenue', or 'Occupancy', run `hotel_stats_tool`.\n"
+        "2. If asked 'Who booked Room X?', 'Show me all bookings', or 'Check-ins today', run `get_booking_details_tool`.\n"
+        "   It returns one page; if it ends with a cursor and the manager wants more, call it again with that cursor.\n"
+        "3. If asked about a specific guest (by name/email), run `get_guest_info_tool`.\n"
+        "4. If asked about room availability, run `check_availability_tool`.\n"
+        "5. If asked about a period (a month, a quarter, 'this year') or ADR/RevPAR, run `hotel_analytics_tool`.\n"
+        "**REPORTING STYLE:**\n"
+        "- Output the exact data from the tools.\n"
+        "- Do NOT hide any booking details provided by the tool.\n"
+        "- Do NOT say 'availability may change'. Just state the facts.\n"
+        "**STRICT:** Do not book rooms yourself. You are an analyst."
+    ),
+    [hotel_stats_tool, hotel_analytics_tool, get_guest_info_tool, check_availability_tool, get_booking_details_tool],
+)
+
+# 🛎️ GUEST PERSONA - REINFORCED TRIGGER
+register_role(
+    "guest",
+    (
+        "You are the **Grand Hotel Concierge**. Warm, professional, and precise.\n\n"
+        "**GOAL:** Help the user book a room. Follow these steps strictly:\n"
+        "1. **Inquiry:** Confirm features and ask for check-in/out dates.\n"
+        "2. **Check:** Use `check_availability_tool` ONLY when you have valid dates.\n"
+        "   **IMPORTANT:** Always convert dates to 'YYYY-MM-DD' format before calling tools (e.g. '2025-12-30').\n"
+        "3. **Offer:** Present available rooms clearly.\n"
+        "4. When you get the check in and check out dates, list the available rooms in tabular format.\n"
+        "4. **Pre-Confirmation:** Once a user picks a room, summarize: Room, Dates, and Guest count.\n"
+        "   Ask: 'Shall I proceed with opening the reservation form for you?'\n"
+        "5. **Trigger:** ONLY if the user gives a positive confirmation (e.g., 'Yes', 'Proceed'), "
+        "reply with the exact phrase: 'I am opening the reservation form now. <SHOW_BOOKING_FORM>'\n\n"
+        "**🚨 CRITICAL RULES:**\n"
+        "- **NO HIDDEN FORMS:** Do not use <SHOW_BOOKING_FORM> until the user says YES to your summary.\n"
+        "- **SYSTEM ALERTS:** If you see a 'SYSTEM ALERT' confirming a booking, stop the sales process. "
+        "Welcome them to the hotel and ask if they need anything else.\n"
+        "- **VOICE:** Be professional. Never say 'I will use a tool'."
+    ),
+    [check_availability_tool, book_room_tool],
+)
@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, messages_from_dict, messages_to_dict
+
+from app.core.config import settings
+from app.core import metrics
+from app.ai.history import history_manager
+from app.db.session import SessionLocal
+from app.db.models import ChatSession
+
+
+def trim_history(messages: List[BaseMessage], max_messages: int) -> List[BaseMessage]:
+    """
+    Keeps at most `max_messages`, dropping the oldest turns first.
+    The kept window always starts at a HumanMessage, so a tool call is never
+    separated from its result.
+    """
+    if len(messages) <= max_messages:
+        return list(messages)
+
+    window = messages[-max_messages:]
+    for i, msg in enumerate(window):
+        if isinstance(msg, HumanMessage):
+            return list(window[i:])
+    return []
+
+
+# ============================================================
+# DURABLE BACKENDS
+# ============================================================
+class SessionBackend:
+    """No durable copy: history lives only in the worker's LRU."""
+
+    # True when load/save do blocking I/O (callers on the event loop should use a thread)
+    durable = False
+
+    def load(self, session_id: str) -> Optional[List[BaseMessage]]:
+        return None
+
+    def save(self, session_id: str, messages: List[BaseMessage]):
+        pass
+
+    def delete(self, session_id: str):
+        pass
+
+
+class SQLSessionBackend(SessionBackend):
+    """Write-through copy in the chat_sessions table, so any worker can resume a session."""
+
+    durable = True
+
+    def load(self, session_id: str) -> Optional[List[BaseMessage]]:
+        db = SessionLocal()
+        try:
+            row = db.get(ChatSession, session_id)
+            return messages_from_dict(json.loads(row.messages)) if row else None
+        finally:
+            db.close()
+
+    def save(self, session_id: str, messages: List[BaseMessage]):
+        db = SessionLocal()
+        try:
+            db.merge(ChatSession(session_id=session_id, messages=json.dumps(messages_to_dict(messages))))
+            db.commit()
+        finally:
+            db.close()
+
+    def delete(self, session_id: str):
+        db = SessionLocal()
+        try:
+            db.query(ChatSession).filter(ChatSession.session_id == session_id).delete()
+            db.commit()
+        finally:
+            db.close()
+
+
+BACKENDS = {
+    "memory": SessionBackend,
+    "sql": SQLSessionBackend,
+}
+
+
+# ============================================================
+# BOUNDED IN-MEMORY STORE
+# ============================================================
+class SessionStore:
+    """
+    Per-session chat history with a fixed memory ceiling.
+
+    - LRU: at most `max_sessions` sessions are held in memory.
+    - TTL: sessions idle for `ttl_seconds` are dropped from memory.
+    - Each session keeps at most `max_messages` messages (plus the running summary of older turns).
+    Evicted sessions are reloaded from the durable backend on next use.
+    """
+
+    def __init__(self, backend: SessionBackend, max_sessions: int, ttl_seconds: int, max_messages: int):
+        self.backend = backend
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.max_messages = max_messages
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()  # id -> (last_used, messages)
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _fit(self, messages: List[BaseMessage], record: bool = False) -> List[BaseMessage]:
+        """Caps a history at `max_messages`, folding what's dropped into the running summary."""
+        if settings.HISTORY_COMPACTION_ENABLED:
+            compaction = history_manager.compact(messages, max_messages=self.max_messages)
+            if record:
+                history_manager.record(compaction)
+            return compaction.messages
+        return trim_history(messages, self.max_messages)
+
+    def _evict_locked(self, now: float):
+        # Oldest entries sit at the front, so expired ones are found without a full scan
+        while self._sessions:
+            session_id, (last_used, _) = next(iter(self._sessions.items()))
+            if len(self._sessions) <= self.max_sessions and now - last_used < self.ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+        metrics.CHAT_SESSIONS.set(len(self._sessions))
+
+    def get(self, session_id: str) -> List[BaseMessage]:
+        """Returns a copy of the session's history (empty for a new session)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                if now - entry[0] < self.ttl_seconds:
+                    self._sessions[session_id] = (now, entry[1])
+                    self._sessions.move_to_end(session_id)
+                    return list(entry[1])
+                # Idle past the TTL: drop it, the backend copy (if any) is reloaded below
+                del self._sessions[session_id]
+                self.evictions += 1
+
+        messages = self.backend.load(session_id) or []
+        # Saved copies are already fitted; only a lower cap set since then needs another pass
+        if len(messages) > self.max_messages + 1:
+            messages = self._fit(messages)
+        with self._lock:
+            self._sessions[session_id] = (now, messages)
+            self._sessions.move_to_end(session_id)
+            self._evict_locked(now)
+        return list(messages)
+
+    def save(self, session_id: str, messages: List[BaseMessage]):
+        # The one compaction per turn: what is stored is the prompt prefix of the next turn
+        messages = self._fit(messages, record=True)
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_id] = (now, messages)
+            self._sessions.move_to_end(session_id)
+            self._evict_locked(now)
+        self.backend.save(session_id, messages)
+
+    def reset(self, session_id: str):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            metrics.CHAT_SESSIONS.set(len(self._sessions))
+        self.backend.delete(session_id)
+
+
+def build_session_store() -> SessionStore:
+    backend_cls = BACKENDS.get(settings.SESSION_BACKEND.lower())
+    if backend_cls is None:
+        raise ValueError(f"Unknown SESSION_BACKEND '{settings.SESSION_BACKEND}'. Options: {', '.join(BACKENDS)}")
+    return SessionStore(
+        backend=backend_cls(),
+        max_sessions=settings.SESSION_MAX_SESSIONS,
+        ttl_seconds=settings.SESSION_TTL_SECONDS,
+        max_messages=settings.SESSION_MAX_MESSAGES,
+    )
+
+
+session_store = build_session_store()
@@ -0,0 +1,88 @@
+"""
+Parallel tool execution for one agent turn.
+
+When the model asks for several tools in one message ("occupancy today and
+who is in room 101"), every call starts at once: async tools (those built
+with `coroutine=`) run on the event loop, the synchronous DB-backed ones on
+a bounded thread pool. Each call gets TOOL_TIMEOUT_SECONDS; the ToolMessages
+come back in the order the model asked for them, so a turn costs its slowest
+tool instead of the sum.
+"""
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+
+from app.core.config import settings
+from app.core import metrics
+from app.db import profiler
+
+
+class ParallelToolNode:
+    """Drop-in for langgraph's ToolNode in the async graph: runs the last AIMessage's tool calls concurrently."""
+
+    def __init__(self, tools: List[BaseTool], max_workers: int = 8, timeout_seconds: Optional[float] = 20.0):
+        self.tools_by_name = {t.name: t for t in tools}
+        self.timeout_seconds = timeout_seconds
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool")
+
+    async def __call__(self, state: dict, config: RunnableConfig):
+        message = next((m for m in reversed(state["messages"]) if isinstance(m, AIMessage)), None)
+        calls = message.tool_calls if message else []
+        # gather keeps the input order, whatever order the tools finish in
+        results = await asyncio.gather(*(self._run(call, config) for call in calls))
+        return {"messages": list(results)}
+
+    async def _run(self, call: dict, config: RunnableConfig) -> ToolMessage:
+        name = call["name"]
+        tool = self.tools_by_name.get(name)
+        if tool is None:
+            metrics.TOOL_ERRORS.labels("unknown", "unknown_tool").inc()  # model-made names stay out of the labels
+            content = f"Error: {name} is not a valid tool, try one of [{', '.join(self.tools_by_name)}]."
+            return ToolMessage(content=content, name=name, tool_call_id=call["id"], status="error")
+
+        started = time.perf_counter()
+        try:
+            label = f"tool {name}"
+            if getattr(tool, "coroutine", None) is not None:
+                work = profiler.arun_profiled(label, tool.ainvoke(call["args"], config))
+            else:
+                # copy_context: contextvars set by the request (e.g. the query profiler) follow into the thread
+                ctx = contextvars.copy_context()
+                work = asyncio.get_running_loop().run_in_executor(
+                    self.executor, ctx.run, profiler.run_profiled, label, tool.invoke, call["args"], config
+                )
+            output = await asyncio.wait_for(work, self.timeout_seconds)
+        except asyncio.TimeoutError:
+            metrics.TOOL_ERRORS.labels(name, "timeout").inc()
+            # The worker thread can't be killed; it finishes in the background and its result is dropped
+            content = f"Error: {name} timed out after {self.timeout_seconds:g}s. Please try again."
+            return ToolMessage(content=content, name=name, tool_call_id=call["id"], status="error")
+        except Exception as e:
+            metrics.TOOL_ERRORS.labels(name, "exception").inc()
+            # Same wording as ToolNode's default error handler, so the model can recover
+            content = f"Error: {e!r}\n Please fix your mistakes."
+            return ToolMessage(content=content, name=name, tool_call_id=call["id"], status="error")
+
+        elapsed = time.perf_counter() - started
+        metrics.TOOL_SECONDS.labels(name).observe(elapsed)
+        if isinstance(output, str) and output.startswith("Error"):
+            metrics.TOOL_ERRORS.labels(name, "error_result").inc()
+        content = output if isinstance(output, str) else str(output)
+        return ToolMessage(content=content, name=name, tool_call_id=call["id"])
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_tool_node(tools: List[BaseTool]) -> ParallelToolNode:
+    return ParallelToolNode(
+        tools,
+        max_workers=settings.TOOL_MAX_WORKERS,
+        timeout_seconds=settings.TOOL_TIMEOUT_SECONDS or None,
+    )
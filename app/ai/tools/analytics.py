@@ -0,0 +1,53 @@
+from langchain_core.tools import tool
+from app.db.session import SessionLocal
+from app.services.analytics_service import AnalyticsService
+from app.services.booking_service import parse_date
+
+
+@tool
+def hotel_analytics_tool(start_date: str, end_date: str):
+    """
+    Occupancy and revenue analytics for the nights from start_date up to (not including) end_date.
+    Dates: YYYY-MM-DD. Returns occupancy, ADR, RevPAR and revenue overall and by room type,
+    plus the busiest and quietest nights.
+
+    Use this when the manager asks about a month, a quarter or any period: 'occupancy in March',
+    'revenue last quarter', 'RevPAR this year'. For a single day use `hotel_stats_tool`.
+    """
+    try:
+        start = parse_date(start_date).date()
+        end = parse_date(end_date).date()
+    except (ValueError, TypeError, OverflowError):
+        return "Error: Invalid date format. Please use YYYY-MM-DD."
+
+    db = SessionLocal()
+    try:
+        report = AnalyticsService(db).occupancy_report(start, end)
+    except ValueError as e:
+        return f"Error: {e}."
+    except Exception as e:
+        return f"Error generating analytics: {str(e)}"
+    finally:
+        db.close()
+
+    t = report["totals"]
+    lines = [
+        f"📈 **Analytics {report['start_date']} → {report['end_date']}** ({report['nights']} nights, {report['rooms']} rooms)",
+        f"- **Occupancy:** {t['occupancy'] * 100:.1f}% ({t['room_nights_sold']:,}/{t['room_nights_available']:,} room-nights)",
+        f"- **Revenue:** Rs. {t['revenue']:,.2f}",
+        f"- **ADR:** Rs. {t['adr']:,.2f} | **RevPAR:** Rs. {t['revpar']:,.2f}",
+        "**By Room Type:**",
+    ]
+    for r in report["by_room_type"]:
+        lines.append(
+            f"- {r['room_type']}: {r['occupancy'] * 100:.1f}% | Rs. {r['revenue']:,.2f} | "
+            f"ADR Rs. {r['adr']:,.2f} | RevPAR Rs. {r['revpar']:,.2f}"
+        )
+
+    nights = report["by_night"]
+    if nights:
+        busiest = max(nights, key=lambda n: n["occupancy"])
+        quietest = min(nights, key=lambda n: n["occupancy"])
+        lines.append(f"- **Busiest night:** {busiest['date']} ({busiest['occupancy'] * 100:.1f}%)")
+        lines.append(f"- **Quietest night:** {quietest['date']} ({quietest['occupancy'] * 100:.1f}%)")
+    return "\n".join(lines)
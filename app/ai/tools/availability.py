@@ -1,9 +1,11 @@
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from app.db.session import SessionLocal
+from app.db.async_session import AsyncSessionLocal
 from app.services.booking_service import BookingService
+from app.services.async_booking_service import AsyncBookingService
 
-@tool
-def check_availability_tool(start_date: str, end_date: str):
+
+def check_availability(start_date: str, end_date: str):
     """
     Checks room availability for given dates.
     Input format: YYYY-MM-DD
@@ -13,4 +15,18 @@ def check_availability_tool(start_date: str, end_date: str):
         service = BookingService(db)
         return service.check_availability(start_date, end_date)
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def acheck_availability(start_date: str, end_date: str):
+    async with AsyncSessionLocal() as db:
+        service = AsyncBookingService(db)
+        return await service.check_availability(start_date, end_date)
+
+
+# Sync + async implementations behind one tool: graph.invoke uses the first, graph.ainvoke awaits the second
+check_availability_tool = StructuredTool.from_function(
+    func=check_availability,
+    coroutine=acheck_availability,
+    name="check_availability_tool",
+)
@@ -1,10 +1,11 @@
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from app.db.session import SessionLocal
+from app.db.async_session import AsyncSessionLocal
 from app.services.booking_service import BookingService
+from app.services.async_booking_service import AsyncBookingService
 
 
-@tool
-def book_room_tool(
+def book_room(
         room_number: str,
         name: str,
         email: str,
@@ -42,4 +43,42 @@ def book_room_tool(
     except Exception as e:
         return f"Error processing booking: {str(e)}"
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def abook_room(
+        room_number: str,
+        name: str,
+        email: str,
+        start_date: str,
+        end_date: str,
+        adults: str = "1",
+        children: str = "0"
+):
+    try:
+        safe_adults = int(adults)
+        safe_children = int(children)
+    except ValueError:
+        return "Error: Adults and Children must be valid numbers (e.g. '2')."
+
+    async with AsyncSessionLocal() as db:
+        try:
+            service = AsyncBookingService(db)
+            return await service.book_room(
+                room_number=room_number,
+                name=name,
+                email=email,
+                start_str=start_date,
+                end_str=end_date,
+                adults=safe_adults,
+                children=safe_children
+            )
+        except Exception as e:
+            return f"Error processing booking: {str(e)}"
+
+
+book_room_tool = StructuredTool.from_function(
+    func=book_room,
+    coroutine=abook_room,
+    name="book_room_tool",
+)
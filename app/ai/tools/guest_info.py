@@ -1,10 +1,21 @@
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
+from sqlalchemy import select
 from app.db.session import SessionLocal
+from app.db.async_session import AsyncSessionLocal
 from app.db.models import Guest, Booking
 
 
-@tool
-def get_guest_info_tool(email: str):
+def _format_guest(guest, bookings):
+    booking_list = "\n".join(
+        [f"- Room {b.room_id}: {b.check_in_date} to {b.check_out_date} ({b.status})" for b in bookings])
+
+    return (f"Name: {guest.name}\n"
+            f"Email: {guest.email}\n"
+            f"Phone: {guest.phone}\n"
+            f"Booking History:\n{booking_list if booking_list else 'No history'}")
+
+
+def get_guest_info(email: str):
     """
     Fetches all information about a guest including their booking history using their email.
     """
@@ -15,12 +26,23 @@ def get_guest_info_tool(email: str):
             return f"No guest found with email: {email}"
 
         bookings = db.query(Booking).filter(Booking.guest_id == guest.id).all()
-        booking_list = "\n".join(
-            [f"- Room {b.room_id}: {b.check_in_date} to {b.check_out_date} ({b.status})" for b in bookings])
-
-        return (f"Name: {guest.name}\n"
-                f"Email: {guest.email}\n"
-                f"Phone: {guest.phone}\n"
-                f"Booking History:\n{booking_list if booking_list else 'No history'}")
+        return _format_guest(guest, bookings)
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def aget_guest_info(email: str):
+    async with AsyncSessionLocal() as db:
+        guest = await db.scalar(select(Guest).where(Guest.email == email))
+        if not guest:
+            return f"No guest found with email: {email}"
+
+        bookings = (await db.scalars(select(Booking).where(Booking.guest_id == guest.id))).all()
+        return _format_guest(guest, bookings)
+
+
+get_guest_info_tool = StructuredTool.from_function(
+    func=get_guest_info,
+    coroutine=aget_guest_info,
+    name="get_guest_info_tool",
+)
@@ -1,58 +1,72 @@
 from datetime import datetime
 from typing import Optional  # <--- 1. ADD THIS IMPORT
 from langchain_core.tools import tool
+from app.core.config import settings
 from app.db.session import SessionLocal
-from app.db.models import Booking, Room, Guest
+from app.services.booking_list_service import BookingListService, stay_status
+from app.services.booking_service import parse_date
+
+STAY_ICONS = {"In-House": "🟢 In-House", "Upcoming": "🟡 Upcoming", "Departing Today": "🔴 Departing Today"}
 
 
 @tool
-def get_booking_details_tool(room_number: Optional[str] = None):  # <--- 2. CHANGE THIS LINE
+def get_booking_details_tool(room_number: Optional[str] = None, room_type: Optional[str] = None,
+                             start_date: Optional[str] = None, end_date: Optional[str] = None,
+                             cursor: Optional[str] = None):  # <--- 2. CHANGE THIS LINE
     """
-    Fetches booking details for the Manager.
+    Fetches booking details for the Manager, one page at a time (check-in order).
     - If 'room_number' is provided (e.g. "101"), shows who booked that specific room and when.
-    - If NO room_number is provided (or None), shows a list of ALL active and upcoming bookings.
+    - If NO room_number is provided (or None), lists ALL active and upcoming bookings.
+    - Optional filters: 'room_type' (e.g. "Penthouse"), 'start_date' / 'end_date' (YYYY-MM-DD)
+      to list stays between those dates.
+    - If the result ends with a cursor, call again with the same filters and that 'cursor' for the next page.
     """
+    try:
+        start = parse_date(start_date).date() if start_date else None
+        end = parse_date(end_date).date() if end_date else None
+    except (ValueError, TypeError, OverflowError):
+        return "Error: Invalid date format. Please use YYYY-MM-DD."
+
     db = SessionLocal()
     try:
         today = datetime.now().date()
 
-        # Start the query
-        query = db.query(Booking).join(Room).join(Guest)
-
-        # FILTER: Show only Active (Currently in-house) or Future bookings
-        query = query.filter(Booking.check_out_date >= today)
+        # One query per page: room + guest loaded with the bookings, no OFFSET
+        page = BookingListService(db).page(
+            settings.BOOKING_TOOL_PAGE_SIZE, cursor, room_type=room_type, room_number=room_number,
+            start=start, end=end,
+        )
 
-        # OPTIONAL FILTER: Specific Room
         if room_number:
-            query = query.filter(Room.room_number == room_number)
             header = f"📅 **Schedule for Room {room_number}**"
+        elif room_type:
+            header = f"📅 **{room_type} Bookings**"
         else:
             header = "📅 **All Active & Upcoming Bookings**"
 
-        bookings = query.order_by(Booking.check_in_date).all()
-
-        if not bookings:
-            return "No active or upcoming bookings found."
+        if not page.items:
+            return "No more bookings." if cursor else "No active or upcoming bookings found."
 
         # Format the Output
         report_lines = [header]
-        for b in bookings:
-            status = "Unknown"
-            if b.check_in_date.date() <= today < b.check_out_date.date():
-                status = "🟢 In-House"
-            elif b.check_in_date.date() > today:
-                status = "🟡 Upcoming"
-            elif b.check_out_date.date() == today:
-                status = "🔴 Departing Today"
-
+        for b in page.items:
+            status = STAY_ICONS.get(stay_status(b, today), "Unknown")
+            guest = f"{b.guest.name} ({b.guest.email})" if b.guest else "Unknown"
             report_lines.append(
                 f"- **{b.check_in_date.strftime('%Y-%m-%d')}** to **{b.check_out_date.strftime('%Y-%m-%d')}**\n"
-                f"  Room {b.room.room_number} ({b.room.room_type}) | Guest: {b.guest.name} ({b.guest.email}) | Status: {status}"
+                f"  Room {b.room.room_number} ({b.room.room_type}) | Guest: {guest} | Status: {status}"
             )
 
+        if page.next_cursor:
+            report_lines.append(
+                f"\n(Showing {len(page.items)}. More bookings: call get_booking_details_tool again with the same "
+                f"filters and cursor=\"{page.next_cursor}\".)"
+            )
         return "\n".join(report_lines)
 
+    except ValueError as e:
+        return f"Error: {e}"
     except Exception as e:
         return f"Error fetching bookings: {str(e)}"
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,61 +1,60 @@
 from datetime import datetime
+from typing import Optional
 from langchain_core.tools import tool
 from app.db.session import SessionLocal
-from app.db.models import Room, Booking
+from app.db.repositories.stats_repo import StatsRepository
+from app.services.booking_service import parse_date
 
 
 @tool
-def hotel_stats_tool(**kwargs):
+def hotel_stats_tool(date: Optional[str] = None):
     """
-    Fetches the current 'Daily Status Report' for the hotel.
+    Fetches the 'Daily Status Report' for the hotel (today, or the given date as YYYY-MM-DD).
     Returns:
     - Occupancy Rate (Percentage of rooms taken)
-    - Total Revenue (Price of all currently occupied rooms)
-    - Total Guests (Number of people currently in the hotel)
+    - Total Revenue (Price of all occupied rooms that night)
+    - Total Guests (Number of people in the hotel)
+    - The same figures broken down by room type
 
     Use this when the manager asks: 'Status report', 'How are we doing?', 'Occupancy?', or 'Revenue today'.
     """
+    try:
+        day = parse_date(date).date() if date else datetime.now().date()
+    except (ValueError, TypeError, OverflowError):
+        return "Error: Invalid date format. Please use YYYY-MM-DD."
+
     db = SessionLocal()
     try:
-        today = datetime.now().date()
+        # One aggregate query, whatever the number of bookings
+        rows = StatsRepository(db).occupancy_by_room_type(day)
 
         # 1. Total Capacity
-        total_rooms = db.query(Room).count()
+        total_rooms = sum(r.rooms for r in rows)
         if total_rooms == 0:
             return "Error: No rooms configured in the database."
 
-        # 2. Find Active Bookings (Guests inside the hotel RIGHT NOW)
-        # Logic: Booking starts on or before today, and ends after today
-        active_bookings = db.query(Booking).filter(
-            Booking.check_in_date <= today,
-            Booking.check_out_date > today
-        ).all()
-
-        occupied_count = len(active_bookings)
+        # 2. Totals across room types
+        occupied_count = sum(r.occupied for r in rows)
         occupancy_rate = (occupied_count / total_rooms) * 100
-
-        # 3. Calculate Revenue (Sum of prices of occupied rooms)
-        current_revenue = 0
-        total_guests = 0
-
-        for booking in active_bookings:
-            # We need to fetch the room price for each booking
-            room = db.query(Room).filter(Room.id == booking.room_id).first()
-            if room:
-                current_revenue += room.price
-
-            # Count people
-            total_guests += (booking.adults + booking.children)
-
-        # 4. Format the Report
-        return (
-            f"  **Daily Hotel Pulse ({today})**\n"
-            f"- **Occupancy:** {occupancy_rate:.1f}% ({occupied_count}/{total_rooms} rooms)\n"
-            f"- **Current Revenue:** Rs. {current_revenue:,.2f} (Daily Run Rate)\n"
-            f"- **Guests In-House:** {total_guests}\n"
-        )
+        current_revenue = sum(r.revenue for r in rows)
+        total_guests = sum(r.guests for r in rows)
+
+        # 3. Format the Report
+        lines = [
+            f"  **Daily Hotel Pulse ({day})**",
+            f"- **Occupancy:** {occupancy_rate:.1f}% ({occupied_count}/{total_rooms} rooms)",
+            f"- **Current Revenue:** Rs. {current_revenue:,.2f} (Daily Run Rate)",
+            f"- **Guests In-House:** {total_guests}",
+            "**By Room Type:**",
+        ]
+        for r in rows:
+            lines.append(
+                f"- {r.room_type}: {r.occupied}/{r.rooms} rooms ({(r.occupied / r.rooms) * 100:.0f}%) | "
+                f"Rs. {r.revenue:,.2f} | {r.guests} guests"
+            )
+        return "\n".join(lines) + "\n"
 
     except Exception as e:
         return f"Error generating stats: {str(e)}"
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,15 +1,25 @@
+import time
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app.core.config import settings
-from app.db.session import engine, Base
-from app.api.v1.routers import chat, bookings
+from app.core import metrics
+from app.db import profiler
+from app.db.session import engine, SessionLocal
+from app.db.async_session import async_engine
+from app.db.migrations import run_migrations
+from app.db.repositories.availability_index import availability_index
+from app.api.v1.routers import chat, bookings, analytics
+from app.api.v1.routers import metrics as metrics_router
 from app.services.report_service import ReportService  # <--- NEW IMPORT
+from app.services.email_worker import email_worker
+from app.ai.graph import tool_node
 
-# Create Tables
-Base.metadata.create_all(bind=engine)
+# Create Tables (and any indexes missing from an older hotel.db)
+run_migrations(engine)
 
 # --- SCHEDULER SETUP ---
 scheduler = BackgroundScheduler()
@@ -17,15 +27,27 @@ report_service = ReportService()
 
 
 def run_daily_report():
-    """Wrapper function for the scheduler"""
-    report_service.generate_and_send()
+    """Wrapper function for the scheduler (hands the work to the report thread and returns)"""
+    report_service.submit()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 🟢 STARTUP LOGIC
-    print("🚀 Server Starting... Sending Manager Report...")
-    run_daily_report()  # <--- 1. Send immediately on start
+    if settings.AVAILABILITY_INDEX_ENABLED:
+        print("📇 Loading availability index...")
+        db = SessionLocal()
+        try:
+            availability_index.load(db)
+        finally:
+            db.close()
+
+    if settings.EMAIL_OUTBOX_ENABLED:
+        print("📬 Starting Email Outbox Worker...")
+        email_worker.start()
+
+    print("🚀 Server Starting... Queuing Manager Report...")
+    run_daily_report()  # <--- 1. Send on start (in the background, startup doesn't wait)
 
     print("⏰ Starting Scheduler (Daily at 12:00 PM)...")
     # <--- 2. Schedule for 12:00 PM everyday
@@ -37,6 +59,11 @@ async def lifespan(app: FastAPI):
     # 🔴 SHUTDOWN LOGIC
     print("🛑 Server Stopping... Killing Scheduler")
     scheduler.shutdown()
+    report_service.shutdown()
+    email_worker.stop()
+    tool_node.shutdown()
+    await async_engine.dispose()
+    metrics.mark_process_dead()
 
 
 app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
@@ -44,6 +71,31 @@ app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 # --- ROUTERS ---
 app.include_router(chat.router, tags=["Chat"])
 app.include_router(bookings.router, tags=["Bookings"])
+app.include_router(analytics.router, tags=["Analytics"])
+app.include_router(metrics_router.router, tags=["Metrics"])
+
+
+if settings.QUERY_PROFILER_ENABLED:
+    @app.middleware("http")
+    async def profile_request_queries(request: Request, call_next):
+        """One profiler unit of work per request (query count, slow queries, N+1 warnings)."""
+        with profiler.profile(f"{request.method} {request.url.path}") as unit:
+            response = await call_next(request)
+            # Streaming responses: only the queries run before the first byte
+            response.headers["X-Query-Count"] = str(unit.count)
+            return response
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Per-route latency histogram, labelled by the route template (not the raw path) to keep cardinality low."""
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    metrics.HTTP_REQUEST_SECONDS.labels(
+        request.method, route.path if route else "unmatched", str(response.status_code)
+    ).observe(time.perf_counter() - started)
+    return response
 
 
 @app.get("/")
@@ -0,0 +1,31 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.core.security import require_manager
+from app.db.session import SessionLocal
+from app.services.analytics_service import AnalyticsService
+
+router = APIRouter()
+
+
+# Dependency to get DB session
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@router.get("/analytics/occupancy", dependencies=[Depends(require_manager)])
+def occupancy_analytics(start_date: date, end_date: date, include_nights: bool = True,
+                        db: Session = Depends(get_db)):
+    """
+    Manager only (X-Manager-Key). Per-night occupancy and revenue, with ADR / RevPAR
+    overall and by room type, for [start_date, end_date).
+    """
+    try:
+        return AnalyticsService(db).occupancy_report(start_date, end_date, include_nights=include_nights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,8 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date, datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.security import require_manager
 from app.db.session import SessionLocal
-from app.services.booking_service import BookingService
+from app.db.async_session import get_async_db
+from app.services.async_booking_service import AsyncBookingService
+from app.services.availability_cache import availability_cache
+from app.services.booking_list_service import BookingListService, booking_to_dict
 
 router = APIRouter()
 
@@ -27,9 +36,9 @@ class BookingRequest(BaseModel):
 
 
 @router.post("/book")
-def create_booking(req: BookingRequest, db: Session = Depends(get_db)):
-    service = BookingService(db)
-    result = service.book_room(
+async def create_booking(req: BookingRequest, db: AsyncSession = Depends(get_async_db)):
+    service = AsyncBookingService(db)
+    result = await service.book_room(
         req.room_number,
         req.name,
         req.email,
@@ -42,4 +51,77 @@ def create_booking(req: BookingRequest, db: Session = Depends(get_db)):
     if "Error" in result:
         raise HTTPException(status_code=400, detail=result)
 
-    return {"status": "success", "message": result}
\ No newline at end of file
+    return {"status": "success", "message": result}
+
+
+class BatchRoom(BaseModel):
+    room_number: str
+    # Default to the batch's dates
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    adults: int = 1
+    children: int = 0
+
+
+class BatchBookingRequest(BaseModel):
+    name: str
+    email: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    rooms: List[BatchRoom]
+
+
+@router.post("/bookings/batch")
+async def create_batch_booking(req: BatchBookingRequest, db: AsyncSession = Depends(get_async_db)):
+    """Books every listed room for one guest/group in a single transaction (all or nothing)."""
+    stays = []
+    for room in req.rooms:
+        stay = room.model_dump()
+        stay["start_date"] = room.start_date or req.start_date
+        stay["end_date"] = room.end_date or req.end_date
+        if not stay["start_date"] or not stay["end_date"]:
+            raise HTTPException(status_code=400, detail=f"Error: Missing dates for Room {room.room_number}.")
+        stays.append(stay)
+
+    result = await AsyncBookingService(db).book_rooms(req.name, req.email, stays)
+    if "Error" in result:
+        raise HTTPException(status_code=400, detail=result)
+
+    return {"status": "success", "message": result}
+
+
+@router.get("/bookings", dependencies=[Depends(require_manager)])
+def list_bookings(
+        cursor: Optional[str] = None,
+        limit: int = Query(settings.BOOKING_PAGE_SIZE, ge=1, le=settings.BOOKING_PAGE_MAX),
+        status: Optional[str] = None,
+        room_type: Optional[str] = None,
+        room_number: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        include_past: bool = False,
+        db: Session = Depends(get_db),
+):
+    """
+    Manager only (X-Manager-Key): guest names and emails are in the response.
+    One page of bookings in check-in order (active and upcoming by default).
+    Pass `next_cursor` back as `cursor` with the same filters for the next page.
+    """
+    try:
+        page = BookingListService(db).page(limit, cursor, status, room_type, room_number,
+                                           start_date, end_date, include_past)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Error: {e}")
+
+    today = datetime.now().date()
+    return {
+        "items": [booking_to_dict(b, today) for b in page.items],
+        "count": len(page.items),
+        "next_cursor": page.next_cursor,
+    }
+
+
+@router.get("/availability/cache")
+def availability_cache_stats():
+    """Hit / miss / eviction counters for this worker's availability cache."""
+    return availability_cache.stats()
@@ -1,51 +1,229 @@
+import asyncio
+import json
+import time
+import uuid
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, List, Any
 
 # Import your AI Brain
 from app.ai.graph import app_graph
-from langchain_core.messages import HumanMessage
+from app.ai.session_store import session_store
+from app.ai.history import history_manager
+from app.ai.fast_path import try_fast_path, fast_path_stats
+from app.ai.response_cache import response_cache, cacheable_answer
+from app.core.config import settings
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, ToolMessage
 
 router = APIRouter()
 
-# Simple In-Memory Database for Chat History
-# (In production, use Redis)
-MEMORY_STORE = {}
+# Caps concurrent graph runs in this process (LLM + tool round trips)
+CHAT_SLOTS = asyncio.Semaphore(settings.CHAT_MAX_CONCURRENCY)
 
 
 class ChatRequest(BaseModel):
     message: str
     role: str = "guest"
+    # Issued by the server on the first reply; clients send it back to continue the conversation
+    session_id: str | None = None
+
+
+def session_key(req: ChatRequest) -> str:
+    """Store key: the role is part of it, so guest and manager histories never mix."""
+    return f"{req.role}:{req.session_id}"
+
+
+async def load_history(key: str):
+    if session_store.backend.durable:
+        return await asyncio.to_thread(session_store.get, key)
+    return session_store.get(key)
+
+
+async def save_history(key: str, messages):
+    if session_store.backend.durable:
+        await asyncio.to_thread(session_store.save, key, messages)
+    else:
+        session_store.save(key, messages)
+
+
+async def acquire_chat_slot():
+    try:
+        await asyncio.wait_for(CHAT_SLOTS.acquire(), timeout=settings.CHAT_QUEUE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="The concierge is busy. Please try again shortly.")
+
+
+async def run_graph(state: dict) -> dict:
+    """Runs the agent graph on the event loop, bounded by CHAT_SLOTS."""
+    await acquire_chat_slot()
+    started = time.perf_counter()
+    try:
+        return await app_graph.ainvoke(state)
+    finally:
+        fast_path_stats.record_llm(time.perf_counter() - started)
+        CHAT_SLOTS.release()
 
 
 @router.post("/chat")
 async def chat_endpoint(req: ChatRequest):
-    user_id = "default_user"  # Simplified for now
+    req.session_id = req.session_id or uuid.uuid4().hex
+    key = session_key(req)
 
     # 1. Retrieve History
-    history = MEMORY_STORE.get(user_id, [])
+    history = await load_history(key)
 
     # 2. Add User Message
     history.append(HumanMessage(content=req.message))
 
-    # 3. Process with LangGraph
-    # We pass the role to the state so the prompt knows who is talking
-    state = {"messages": history, "user_role": req.role}
-    result = app_graph.invoke(state)
+    # 3. Same question, same data: answer from the response cache
+    cache_key = response_cache.key(req.role, req.message) if settings.RESPONSE_CACHE_ENABLED else None
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        messages = history + [AIMessage(content=cached)]
+    else:
+        # 3b. Structured requests are answered straight from the tool, no LLM round trips
+        fast = await try_fast_path(req.message, req.role) if settings.FAST_PATH_ENABLED else None
+        if fast:
+            messages = history + fast
+        else:
+            # 3c. Process with LangGraph
+            # We pass the role to the state so the prompt knows who is talking
+            state = {"messages": history, "user_role": req.role}
+            messages = (await run_graph(state))["messages"]
+        response_cache.put(cache_key, cacheable_answer(messages[len(history):]))
 
     # 4. Extract AI Response
-    bot_msg = result["messages"][-1]
+    bot_msg = messages[-1]
 
     # 5. Update History
-    # LangGraph returns the full updated list, so we save that
-    MEMORY_STORE[user_id] = result["messages"]
+    # LangGraph returns the full updated list; the store trims it to the per-session cap
+    await save_history(key, messages)
+
+    return {"response": bot_msg.content, "session_id": req.session_id}
+
+
+def _sse(event: str, data: dict) -> str:
+    """Formats one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def stream_graph(state: dict, req: ChatRequest, cache_key=None):
+    """
+    Yields SSE frames while the graph runs:
+    - token:      LLM text chunks from the agent node
+    - tool_start: a tool call the agent decided to make
+    - tool_end:   that tool's result
+    - done:       the final reply (history is saved at this point)
+    - error:      the worker is busy or the graph failed
+    """
+    try:
+        await acquire_chat_slot()
+    except HTTPException as e:
+        yield _sse("error", {"detail": e.detail})
+        return
+
+    messages = list(state["messages"])
+    started = time.perf_counter()
+    try:
+        async for mode, payload in app_graph.astream(state, stream_mode=["messages", "updates"]):
+            if mode == "messages":
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") == "agent" and isinstance(chunk, AIMessageChunk) and chunk.content:
+                    yield _sse("token", {"content": chunk.content})
+                continue
+
+            # mode == "updates": {node_name: {"messages": [...]}} once each node finishes
+            for node, update in payload.items():
+                new_messages = (update or {}).get("messages", [])
+                messages.extend(new_messages)
+                for msg in new_messages:
+                    if isinstance(msg, AIMessage):
+                        for call in msg.tool_calls:
+                            yield _sse("tool_start", {"id": call["id"], "name": call["name"], "args": call["args"]})
+                    elif isinstance(msg, ToolMessage):
+                        yield _sse("tool_end", {"id": msg.tool_call_id, "name": msg.name, "content": msg.content})
 
-    return {"response": bot_msg.content}
+        fast_path_stats.record_llm(time.perf_counter() - started)
+        response_cache.put(cache_key, cacheable_answer(messages[len(state["messages"]):]))
+        await save_history(session_key(req), messages)
+        yield _sse("done", {"response": messages[-1].content, "session_id": req.session_id})
+    except Exception as e:
+        yield _sse("error", {"detail": f"Error generating response: {e}"})
+    finally:
+        CHAT_SLOTS.release()
+
+
+async def stream_cached(history: list, answer: str, req: ChatRequest):
+    """A response-cache hit: the whole answer as one token, then done."""
+    yield _sse("token", {"content": answer})
+    await save_history(session_key(req), history + [AIMessage(content=answer)])
+    yield _sse("done", {"response": answer, "session_id": req.session_id})
+
+
+async def stream_fast_path(history: list, fast: list, req: ChatRequest, cache_key=None):
+    """Same SSE events as stream_graph for a fast-path answer (the reply arrives as one token)."""
+    call, result, reply = fast
+    for c in call.tool_calls:
+        yield _sse("tool_start", {"id": c["id"], "name": c["name"], "args": c["args"]})
+    yield _sse("tool_end", {"id": result.tool_call_id, "name": result.name, "content": result.content})
+    yield _sse("token", {"content": reply.content})
+    response_cache.put(cache_key, cacheable_answer(fast))
+    await save_history(session_key(req), history + fast)
+    yield _sse("done", {"response": reply.content, "session_id": req.session_id})
+
+
+@router.post("/chat/stream")
+async def chat_stream_endpoint(req: ChatRequest):
+    req.session_id = req.session_id or uuid.uuid4().hex
+
+    history = await load_history(session_key(req))
+    history.append(HumanMessage(content=req.message))
+
+    cache_key = response_cache.key(req.role, req.message) if settings.RESPONSE_CACHE_ENABLED else None
+    cached = response_cache.get(cache_key)
+    fast = None
+    if cached is None and settings.FAST_PATH_ENABLED:
+        fast = await try_fast_path(req.message, req.role)
+
+    if cached is not None:
+        events = stream_cached(history, cached, req)
+    elif fast:
+        events = stream_fast_path(history, fast, req, cache_key)
+    else:
+        events = stream_graph({"messages": history, "user_role": req.role}, req, cache_key)
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/reset")
 async def reset_endpoint(req: ChatRequest):
-    user_id = "default_user"
-    if user_id in MEMORY_STORE:
-        MEMORY_STORE[user_id] = []
-    return {"status": "Memory cleared"}
\ No newline at end of file
+    if req.session_id:
+        if session_store.backend.durable:
+            await asyncio.to_thread(session_store.reset, session_key(req))
+        else:
+            session_store.reset(session_key(req))
+    return {"status": "Memory cleared"}
+
+
+@router.get("/chat/history/stats")
+def history_stats():
+    """History tokens carried into each next turn vs. the uncompacted histories, for this worker."""
+    return history_manager.stats()
+
+
+@router.get("/chat/fast-path/stats")
+def fast_path_stats_endpoint():
+    """How often structured messages skipped the LLM, and the latency that saved."""
+    return fast_path_stats.stats()
+
+
+@router.get("/chat/response-cache/stats")
+def response_cache_stats():
+    """Hit / miss counters of the manager answer cache, and the current bookings data version."""
+    return response_cache.stats()
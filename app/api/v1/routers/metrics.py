@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from app.core import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus scrape endpoint (all workers' samples when PROMETHEUS_MULTIPROC_DIR is set)."""
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
@@ -8,15 +8,97 @@ class Settings(BaseSettings):
 
     # --- Database ---
     DATABASE_URL: str = "sqlite:///./hotel.db"
+    # Optional override for the async engine; derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: str | None = None
+    DB_ECHO: bool = False
+    # "auto" picks from DATABASE_URL: "sqlite" for dev files, "server" for Postgres etc.
+    DB_ENGINE_PROFILE: str = "auto"
+
+    # SQLite profile
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE: int = -64000  # negative = KiB, i.e. 64 MB
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MB
+
+    # Server profile (connection pool)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Answer overlap checks from an in-memory per-room index instead of SQL
+    AVAILABILITY_INDEX_ENABLED: bool = False
+    # Cache of check_availability answers (invalidated by overlapping bookings)
+    AVAILABILITY_CACHE_ENABLED: bool = True
+    AVAILABILITY_CACHE_MAX_ENTRIES: int = 1024
+    AVAILABILITY_CACHE_TTL_SECONDS: float = 60.0
+    # Largest group/block reservation accepted by /bookings/batch
+    BATCH_BOOKING_MAX_ROOMS: int = 100
+    # Booking list pages (GET /bookings and the manager's get_booking_details_tool)
+    BOOKING_PAGE_SIZE: int = 50
+    BOOKING_PAGE_MAX: int = 200
+    BOOKING_TOOL_PAGE_SIZE: int = 20  # what goes back through the LLM per call
 
     # --- Security ---
     # This will read SECRET_KEY from .env
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Sent as X-Manager-Key by manager-only endpoints' callers; unset keeps those endpoints closed
+    MANAGER_API_KEY: str | None = None
 
     # --- AI Credentials ---
-    GROQ_API_KEY: str
+    # "groq" (needs GROQ_API_KEY) or "fake" (offline scripted model for profiling / load tests)
+    LLM_PROVIDER: str = "groq"
+    GROQ_API_KEY: str | None = None
+    GROQ_MODEL: str = "llama-3.3-70B-Versatile"
+    FAKE_LLM_LATENCY_SECONDS: float = 0.3  # time to first token
+    FAKE_LLM_TOKENS_PER_SECOND: float = 200.0  # 0 = whole reply at once
+
+    # --- Chat ---
+    # Max graph runs in flight per worker process; extra requests wait up to CHAT_QUEUE_TIMEOUT_SECONDS
+    CHAT_MAX_CONCURRENCY: int = 32
+    CHAT_QUEUE_TIMEOUT_SECONDS: float = 30.0
+    # Answer fully structured messages ("rooms from X to Y", "occupancy today") without the LLM
+    FAST_PATH_ENABLED: bool = True
+    # Repeat questions answered from cache until a booking changes the data
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_ROLES: str = "manager"  # comma-separated
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0  # bounds staleness from other workers' bookings
+    # Tool calls from one model message run concurrently: sync tools on this many threads, each
+    # call capped at TOOL_TIMEOUT_SECONDS (0 = no limit)
+    TOOL_MAX_WORKERS: int = 8
+    TOOL_TIMEOUT_SECONDS: float = 20.0
+
+    # --- Chat Sessions ---
+    SESSION_BACKEND: str = "memory"  # "memory" (per worker) or "sql" (chat_sessions table)
+    SESSION_MAX_SESSIONS: int = 1000  # LRU ceiling of sessions held in memory per worker
+    SESSION_TTL_SECONDS: int = 3600  # idle sessions are dropped from memory after this
+    SESSION_MAX_MESSAGES: int = 40  # per session, oldest turns trimmed first
+
+    # --- Chat History Compaction ---
+    # Recent turns are sent verbatim up to the budget; older ones are folded into a running summary
+    HISTORY_COMPACTION_ENABLED: bool = True
+    HISTORY_TOKEN_BUDGET: int = 3000
+    HISTORY_TOOL_OUTPUT_MAX_TOKENS: int = 300  # tool results from earlier turns are cut to this
+    HISTORY_SUMMARY_MAX_TOKENS: int = 500
+
+    # --- Metrics ---
+    # Shared directory for multi-worker /metrics (uvicorn --workers N); unset = per-process numbers
+    PROMETHEUS_MULTIPROC_DIR: str | None = None
+
+    # --- Query Profiler (debugging; off in production) ---
+    # Per-request / per-tool query counts, slow-query log and N+1 warnings (see app/db/profiler.py)
+    QUERY_PROFILER_ENABLED: bool = False
+    QUERY_PROFILER_SLOW_MS: float = 100.0
+    QUERY_PROFILER_REPEAT_THRESHOLD: int = 10  # same statement shape more often than this = N+1 warning
+
+    # --- Reports ---
+    REPORT_BATCH_SIZE: int = 500  # rows fetched per round trip while streaming the daily report
+    REPORT_MAX_LINES: int = 500  # booking lines listed in the email; the rest are counted
 
     # --- Email Config (Matches your .env now) ---
     # We use aliases so python variables stay clean but map to your specific .env names
@@ -25,6 +107,20 @@ class Settings(BaseSettings):
     EMAIL_PASSWORD: str | None = None
     SMTP_SERVER: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
+    SMTP_STARTTLS: bool = True
+    # Off for local relays / test servers (e.g. aiosmtpd) that take mail without a login
+    SMTP_REQUIRE_AUTH: bool = True
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+    SMTP_IDLE_SECONDS: float = 60.0  # the worker closes its pooled connection after this long unused
+
+    # --- Email Outbox ---
+    # Booking emails are written to the email_outbox table and delivered by a background worker
+    EMAIL_OUTBOX_ENABLED: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_SECONDS: float = 2.0
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = 30.0  # doubles per failed attempt
+    EMAIL_OUTBOX_LEASE_SECONDS: float = 300.0  # a claimed message is retried if not finished by then
 
     class Config:
         env_file = ".env"
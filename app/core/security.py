@@ -1,5 +1,9 @@
+import hmac
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import Header, HTTPException
+from app.core.config import settings
 # In real auth, you'd use python-jose for JWT tokens here
 
 # Setup Password Hashing (Bcrypt is standard)
@@ -9,4 +13,15 @@ def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+
+def require_manager(x_manager_key: Optional[str] = Header(None)):
+    """
+    Dependency for manager-only endpoints (guest PII, revenue).
+    The caller must send MANAGER_API_KEY in the X-Manager-Key header.
+    """
+    if not settings.MANAGER_API_KEY:
+        raise HTTPException(status_code=403, detail="Manager endpoints are disabled (MANAGER_API_KEY is not set).")
+    if not x_manager_key or not hmac.compare_digest(x_manager_key.encode(), settings.MANAGER_API_KEY.encode()):
+        raise HTTPException(status_code=401, detail="Manager access required.")
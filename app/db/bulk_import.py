@@ -0,0 +1,357 @@
+"""
+Bulk loading for rooms, guests and bookings (CSV, Parquet or a synthetic generator).
+
+Rows go to the database as plain tuples (dicts for named-only drivers)
+through the driver's executemany, in chunks, bypassing the ORM and
+SQLAlchemy's per-row parameter processing.
+Secondary indexes are dropped before the load and rebuilt once at the end
+(one sort instead of millions of B-tree updates).
+
+Usage:
+    from app.db.bulk_import import BulkImporter, synthetic_hotel
+    BulkImporter(engine).load_all(synthetic_hotel(500, 2_000_000))
+"""
+import csv
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, Float, Integer, Table, inspect
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.db.session import Base
+from app.db.migrations import ensure_indexes
+import app.db.models  # noqa: F401  (registers the tables on Base.metadata)
+
+# Parents first, so foreign keys always point at loaded rows
+LOAD_ORDER = ["rooms", "guests", "bookings"]
+CHUNK_SIZE = 50_000
+# DB-API paramstyle -> positional placeholder (psycopg2 is "pyformat" but takes %s with tuples)
+POSITIONAL_PLACEHOLDERS = {"qmark": "?", "format": "%s", "pyformat": "%s"}
+
+# table name -> (column names, row iterator)
+Source = Tuple[List[str], Iterable]
+
+
+@dataclass
+class LoadReport:
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        line = f"{self.table:12s} {self.rows:>12,} rows  {self.seconds:8.2f}s"
+        return line + f"  {self.rows_per_second:>12,.0f} rows/s" if self.rows else line
+
+
+# ============================================================
+# VALUE CONVERSION
+# ============================================================
+def _to_datetime(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return datetime.fromisoformat(str(value))
+
+
+def _scalar_default(col):
+    return col.default.arg if col.default is not None and col.default.is_scalar else None
+
+
+def _number(cast, default=None):
+    def convert(value):
+        if value is None or value == "":
+            return default
+        return value if isinstance(value, cast) else cast(value)
+    return convert
+
+
+def _converters(tbl: Table, columns: Sequence[str], dialect_name: str):
+    """
+    (position, function) for the columns whose values may need converting
+    before the driver sees them. Every row goes through them: a native value
+    passes straight through, and None / "" / text are converted (or defaulted)
+    wherever they turn up in the source.
+    """
+    out = []
+    for i, name in enumerate(columns):
+        col_type = tbl.c[name].type
+        default = _scalar_default(tbl.c[name])
+        if isinstance(col_type, DateTime):
+            if dialect_name == "sqlite":
+                # SQLAlchemy's SQLite DATETIME format; dates repeat a lot, so formatted values are cached
+                cache = {}
+
+                def to_sqlite(value, cache=cache):
+                    text = cache.get(value)
+                    if text is None:
+                        dt = _to_datetime(value)
+                        text = dt.isoformat(" ", "microseconds") if dt else None
+                        if len(cache) < 200_000:
+                            cache[value] = text
+                    return text
+
+                out.append((i, to_sqlite))
+            else:
+                out.append((i, _to_datetime))
+        elif isinstance(col_type, Integer):
+            out.append((i, _number(int, default)))
+        elif isinstance(col_type, Float):
+            out.append((i, _number(float, default)))
+    return out
+
+
+def _insert_sql(dialect, table_name: str, columns: Sequence[str]) -> Tuple[str, bool]:
+    """
+    A driver-level INSERT and whether it takes positional (tuple) rows.
+    Drivers with only named parameters get `:name` placeholders and dict rows.
+    """
+    quote = dialect.identifier_preparer.quote
+    placeholder = POSITIONAL_PLACEHOLDERS.get(dialect.paramstyle)
+    if placeholder:
+        values = ", ".join([placeholder] * len(columns))
+    elif dialect.paramstyle == "numeric":
+        values = ", ".join(f":{i + 1}" for i in range(len(columns)))
+    else:
+        values = ", ".join(f":{c}" for c in columns)
+    sql = f"INSERT INTO {quote(table_name)} ({', '.join(quote(c) for c in columns)}) VALUES ({values})"
+    return sql, dialect.paramstyle != "named"
+
+
+def _sync_id_sequence(conn, tbl: Table):
+    """
+    Postgres: explicit ids (synthetic rooms / guests, imported files) don't
+    advance the serial sequence, so move it past max(id) or the next ORM
+    insert collides with a loaded row.
+    """
+    if conn.dialect.name != "postgresql" or "id" not in tbl.c or not tbl.c.id.primary_key:
+        return
+    name = conn.dialect.identifier_preparer.quote(tbl.name)
+    conn.exec_driver_sql(
+        f"SELECT setval(pg_get_serial_sequence('{tbl.name}', 'id'), COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) "
+        f"FROM {name}"
+    )
+
+
+# ============================================================
+# SOURCES
+# ============================================================
+def csv_source(path: str) -> Source:
+    """Header row names the columns; values are converted by column type on load."""
+    f = open(path, newline="", encoding="utf-8")
+    reader = csv.reader(f)
+    columns = next(reader)
+
+    def rows():
+        with f:
+            yield from reader
+
+    return columns, rows()
+
+
+def parquet_source(path: str, batch_size: int = CHUNK_SIZE) -> Source:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet import needs pyarrow (pip install pyarrow).") from e
+
+    pf = pq.ParquetFile(path)
+    columns = pf.schema_arrow.names
+
+    def rows():
+        for batch in pf.iter_batches(batch_size=batch_size):
+            yield from zip(*(batch.column(i).to_pylist() for i in range(batch.num_columns)))
+
+    return columns, rows()
+
+
+def file_source(path: str) -> Source:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return csv_source(path)
+    if ext in (".parquet", ".pq"):
+        return parquet_source(path)
+    raise ValueError(f"Unsupported file type '{ext}' (use .csv or .parquet)")
+
+
+def directory_sources(directory: str) -> Dict[str, Source]:
+    """Finds rooms / guests / bookings .csv or .parquet files in `directory`."""
+    sources = {}
+    for name in LOAD_ORDER:
+        for ext in (".parquet", ".pq", ".csv"):
+            path = os.path.join(directory, name + ext)
+            if os.path.exists(path):
+                sources[name] = file_source(path)
+                break
+    if not sources:
+        raise FileNotFoundError(f"No rooms/guests/bookings .csv or .parquet files in {directory}")
+    return sources
+
+
+ROOM_TYPES = [
+    ("Standard Queen", 1400.0, 2, "Cozy queen bed, great for couples."),
+    ("Deluxe King", 2600.0, 3, "King bed with city view."),
+    ("Family Suite", 4200.0, 4, "Two beds + living area."),
+    ("Penthouse", 9500.0, 6, "Top floor luxury with terrace."),
+]
+
+
+def synthetic_hotel(n_rooms: int, n_bookings: int, n_guests: Optional[int] = None, seed: int = 42,
+                    today: Optional[date] = None) -> Dict[str, Source]:
+    """
+    Rooms of four types, one guest per ~5 bookings, and per-room stays of
+    1-7 nights with 0-3 day gaps (no room is double-booked). The booking
+    history is centred on `today`, so there are guests in-house, arriving and
+    departing like in a live hotel.
+    """
+    n_guests = n_guests or max(100, n_bookings // 5)
+    per_room = -(-n_bookings // n_rooms) if n_rooms else 0
+    span_days = per_room * 6  # mean stay 4 + mean gap 1.5, rounded up
+    first_day = datetime.combine(today or datetime.now().date(), datetime.min.time()) - timedelta(days=span_days // 2)
+
+    def rooms():
+        for i in range(1, n_rooms + 1):
+            room_type, price, capacity, desc = ROOM_TYPES[i % len(ROOM_TYPES)]
+            yield i, str(100 + i), room_type, price, desc, capacity
+
+    def guests():
+        for g in range(1, n_guests + 1):
+            yield g, f"Guest {g}", f"guest{g}@example.com", "N/A"
+
+    def bookings():
+        rand = random.Random(seed).random  # ~3x cheaper than randint at millions of calls
+        days = [first_day + timedelta(days=d) for d in range(span_days * 2 + 16)]
+        made = 0
+        for room_id in range(1, n_rooms + 1):
+            day = int(rand() * 4)
+            for _ in range(per_room):
+                if made == n_bookings:
+                    return
+                nights = 1 + int(rand() * 7)
+                yield room_id, 1 + int(rand() * n_guests), days[day], days[day + nights], 2, 0, "confirmed"
+                day += nights + int(rand() * 4)
+                made += 1
+
+    return {
+        "rooms": (["id", "room_number", "room_type", "price", "description", "capacity"], rooms()),
+        "guests": (["id", "name", "email", "phone"], guests()),
+        "bookings": (["room_id", "guest_id", "check_in_date", "check_out_date", "adults", "children", "status"],
+                     bookings()),
+    }
+
+
+# ============================================================
+# LOADER
+# ============================================================
+class BulkImporter:
+    def __init__(self, engine: Engine, chunk_size: int = CHUNK_SIZE, defer_indexes: bool = True):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.defer_indexes = defer_indexes
+
+    def _drop_secondary_indexes(self, tables: Iterable[str]) -> List[str]:
+        """Drops the non-unique model indexes of `tables`; ensure_indexes() puts them back."""
+        inspector = inspect(self.engine)
+        dropped = []
+        for name in tables:
+            existing = {ix["name"] for ix in inspector.get_indexes(name)}
+            for index in Base.metadata.tables[name].indexes:
+                if not index.unique and index.name in existing:
+                    index.drop(bind=self.engine)
+                    dropped.append(index.name)
+        return dropped
+
+    def load(self, table_name: str, columns: Sequence[str], rows: Iterable) -> LoadReport:
+        """Inserts `rows` (tuples in `columns` order, or dicts) into `table_name` in chunks."""
+        tbl = Base.metadata.tables[table_name]
+        keep = [i for i, c in enumerate(columns) if c in tbl.c]  # unknown file columns are ignored
+        project = None if len(keep) == len(columns) else keep
+        columns = [columns[i] for i in keep]
+        # Dict rows: a missing key gets the column default, like a column the source lacks
+        keyed = [(c, _scalar_default(tbl.c[c])) for c in columns]
+        # Raw inserts skip the ORM's Python-side defaults, so columns the source lacks get them here
+        filled = [c for c in tbl.c if c.name not in columns and _scalar_default(c) is not None]
+        fill = tuple(_scalar_default(c) for c in filled)
+        columns += [c.name for c in filled]
+        with self.engine.connect() as conn:
+            dialect = conn.dialect.name
+            # Driver-level INSERT: the driver gets the values as they are, no per-row bind processing
+            sql, positional = _insert_sql(conn.dialect, table_name, columns)
+            converters = _converters(tbl, columns, dialect)
+            if dialect == "sqlite":
+                conn.exec_driver_sql("PRAGMA synchronous=OFF")  # one big transaction; durability comes at commit
+                conn.commit()
+
+            started = time.perf_counter()
+            total = 0
+            chunk = []
+            try:
+                with conn.begin():
+                    for row in rows:
+                        if isinstance(row, dict):
+                            row = [row.get(c, default) for c, default in keyed]
+                        elif project:
+                            row = [row[i] for i in project]
+                        if fill:
+                            row = tuple(row) + fill
+                        if converters:
+                            row = list(row)
+                            for i, convert in converters:
+                                row[i] = convert(row[i])
+                        chunk.append(tuple(row) if positional else dict(zip(columns, row)))
+                        if len(chunk) >= self.chunk_size:
+                            conn.exec_driver_sql(sql, chunk)
+                            total += len(chunk)
+                            chunk = []
+                    if chunk:
+                        conn.exec_driver_sql(sql, chunk)
+                        total += len(chunk)
+                    _sync_id_sequence(conn, tbl)
+            finally:
+                # Also on a failed load: the pooled connection must not go back with synchronous=OFF
+                if dialect == "sqlite":
+                    conn.exec_driver_sql(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+                    conn.commit()
+        return LoadReport(table_name, total, time.perf_counter() - started)
+
+    def load_all(self, sources: Dict[str, Source]) -> List[LoadReport]:
+        """Loads every source in foreign-key order, with indexes deferred to the end."""
+        Base.metadata.create_all(bind=self.engine)
+        names = [n for n in LOAD_ORDER if n in sources] + [n for n in sources if n not in LOAD_ORDER]
+        if self.defer_indexes:
+            self._drop_secondary_indexes(names)
+
+        reports = []
+        for name in names:
+            columns, rows = sources[name]
+            reports.append(self.load(name, columns, rows))
+
+        if self.defer_indexes:
+            started = time.perf_counter()
+            created = ensure_indexes(self.engine)
+            reports.append(LoadReport(f"indexes ({len(created)})", 0, time.perf_counter() - started))
+        if self.engine.dialect.name == "sqlite":
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("ANALYZE")  # fresh planner stats for the new data
+                conn.commit()
+        return reports
+
+
+def print_reports(reports: List[LoadReport]):
+    rows = sum(r.rows for r in reports)
+    seconds = sum(r.seconds for r in reports)
+    print("📦 Bulk import")
+    for r in reports:
+        print(f"  {r}")
+    print(f"  {'total':12s} {rows:>12,} rows  {seconds:8.2f}s  {rows / seconds if seconds else 0:>12,.0f} rows/s")
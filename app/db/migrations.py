@@ -0,0 +1,43 @@
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from app.db.session import Base
+import app.db.models  # noqa: F401  (registers the tables on Base.metadata)
+
+
+def ensure_indexes(engine: Engine):
+    """
+    Creates any model index missing from an existing database.
+
+    `Base.metadata.create_all` skips tables that already exist, so indexes
+    added to the models later (e.g. ix_bookings_room_dates) never reach an
+    older hotel.db without this step.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=engine)
+                created.append(index.name)
+    return created
+
+
+def run_migrations(engine: Engine):
+    """Brings an existing database up to the current schema."""
+    Base.metadata.create_all(bind=engine)
+    created = ensure_indexes(engine)
+    for name in created:
+        print(f"🛠️  Created missing index {name}")
+    return created
+
+
+if __name__ == "__main__":
+    from app.db.session import engine
+
+    run_migrations(engine)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.session import Base  # <--- This import works now!
@@ -28,6 +28,13 @@ class Guest(Base):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    # Serves the per-room overlap probe used by availability searches
+    __table_args__ = (
+        Index("ix_bookings_room_dates", "room_id", "check_in_date", "check_out_date"),
+        # Keyset pagination of the manager's booking list: ORDER BY check_in_date, id
+        Index("ix_bookings_check_in_id", "check_in_date", "id", "check_out_date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     room_id = Column(Integer, ForeignKey("rooms.id"))
     guest_id = Column(Integer, ForeignKey("guests.id"))
@@ -52,3 +59,30 @@ class User(Base):
     hashed_password = Column(String)
     role = Column(String)
 
+
+class ChatSession(Base):
+    """Durable chat history, one row per session (serialized LangChain messages)."""
+    __tablename__ = "chat_sessions"
+    session_id = Column(String, primary_key=True)
+    messages = Column(Text, default="[]")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+
+class EmailOutbox(Base):
+    """Outgoing email, written in the same transaction as the change that triggers it."""
+    __tablename__ = "email_outbox"
+    # Serves the worker's "due messages" scan
+    __table_args__ = (
+        Index("ix_email_outbox_due", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String, default="pending")  # pending -> sending -> sent | failed
+    attempts = Column(Integer, default=0)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow)
+    last_error = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
@@ -0,0 +1,169 @@
+"""
+Opt-in SQL profiler (QUERY_PROFILER_ENABLED).
+
+`profile(label)` opens a unit of work (one HTTP request, one tool call) in a
+context variable; every statement any engine runs inside it is recorded by
+the before/after_cursor_execute hooks. On exit it prints the query count and
+time, and flags any statement *shape* (literals and IN-lists collapsed) that
+ran more than QUERY_PROFILER_REPEAT_THRESHOLD times: the N+1 signature.
+Slow statements are printed with their parameters as they happen.
+
+Units nest: a tool's queries also count toward the request that called it.
+
+Test helper:
+    with assert_max_queries(3, "hotel_stats_tool"):
+        hotel_stats_tool.invoke({})
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+_current: ContextVar[Optional["QueryProfile"]] = ContextVar("query_profile", default=None)
+_installed = False
+
+_IN_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)|\((?:\s*%\(\w+\)s\s*,)+\s*%\(\w+\)s\s*\)")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with whitespace, numbers and IN (?, ?, ...) lists collapsed, so repeats compare equal."""
+    shape = _SPACES.sub(" ", statement).strip()
+    shape = _IN_LIST.sub("(?...)", shape)
+    return _NUMBER.sub("N", shape)
+
+
+@dataclass
+class QueryProfile:
+    label: str
+    parent: Optional["QueryProfile"] = None
+    queries: List[Tuple[str, object, float]] = field(default_factory=list)  # (statement, params, seconds)
+    shapes: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(q[2] for q in self.queries)
+
+    def record(self, statement: str, parameters, seconds: float):
+        shape = statement_shape(statement)
+        unit = self
+        while unit is not None:
+            unit.queries.append((statement, parameters, seconds))
+            unit.shapes[shape] += 1
+            unit = unit.parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes that ran more than `threshold` times (likely N+1 loops)."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+    def summary(self) -> str:
+        return f"{self.label}: {self.count} queries in {self.total_seconds * 1000:.1f} ms"
+
+
+# ============================================================
+# ENGINE HOOKS
+# ============================================================
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("profiler_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    unit = _current.get()
+    starts = conn.info.get("profiler_query_start")
+    if unit is None or not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    unit.record(statement, parameters, elapsed)
+    if elapsed * 1000 >= settings.QUERY_PROFILER_SLOW_MS:
+        print(f"🐢 Slow query ({elapsed * 1000:.1f} ms) in {unit.label}: {_SPACES.sub(' ', statement)} "
+              f"| params={parameters!r:.300}")
+
+
+def _handle_error(context):
+    starts = context.connection.info.get("profiler_query_start") if context.connection is not None else None
+    if starts and _current.get() is not None:
+        starts.pop()
+
+
+def install():
+    """Hooks every engine (sync and async). Called once; a no-op cost when no unit of work is open."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _installed = True
+
+
+# ============================================================
+# UNITS OF WORK
+# ============================================================
+@contextmanager
+def profile(label: str, report: bool = True):
+    """Records the queries run inside the block; prints a summary and N+1 warnings on exit."""
+    install()
+    unit = QueryProfile(label, parent=_current.get())
+    token = _current.set(unit)
+    try:
+        yield unit
+    finally:
+        _current.reset(token)
+        if report:
+            report_profile(unit)
+
+
+def report_profile(unit: QueryProfile, threshold: Optional[int] = None):
+    threshold = settings.QUERY_PROFILER_REPEAT_THRESHOLD if threshold is None else threshold
+    if unit.count:
+        print(f"🔎 {unit.summary()}")
+    for shape, n in unit.repeated(threshold):
+        print(f"⚠️ Possible N+1 in {unit.label}: ran {n}x → {shape[:300]}")
+
+
+def run_profiled(label: str, fn, *args, **kwargs):
+    """Calls fn inside a unit of work when the profiler is on (for thread-pool tool calls)."""
+    if not settings.QUERY_PROFILER_ENABLED:
+        return fn(*args, **kwargs)
+    with profile(label):
+        return fn(*args, **kwargs)
+
+
+async def arun_profiled(label: str, awaitable):
+    if not settings.QUERY_PROFILER_ENABLED:
+        return await awaitable
+    with profile(label):
+        return await awaitable
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, label: str = "block", max_repeats: Optional[int] = None):
+    """
+    Test helper: fails (AssertionError listing the statements) if the block runs
+    more than `max_queries` queries, or, with `max_repeats`, any one statement
+    shape more than that many times.
+    """
+    with profile(label, report=False) as unit:
+        yield unit
+    if unit.count > max_queries:
+        listing = "\n".join(f"  {i + 1}. {_SPACES.sub(' ', q[0])[:200]}" for i, q in enumerate(unit.queries))
+        raise AssertionError(f"{label} ran {unit.count} queries (max {max_queries}):\n{listing}")
+    if max_repeats is not None:
+        repeated = unit.repeated(max_repeats)
+        if repeated:
+            shape, n = repeated[0]
+            raise AssertionError(f"{label} ran one statement {n} times (max {max_repeats}): {shape[:300]}")
@@ -0,0 +1,157 @@
+from datetime import datetime
+from typing import List, Sequence, Set, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models import Booking, Room, Guest, EmailOutbox
+from app.db.repositories.availability_index import availability_index
+from app.db.repositories.booking_repo import (
+    Stay, booking_rows, overlap_exists, overlaps_any, after_booking_commit,
+)
+
+
+class AsyncBookingRepository:
+    """AsyncSession counterpart of BookingRepository (same queries, same locking)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _index(self):
+        if not settings.AVAILABILITY_INDEX_ENABLED:
+            return None
+        if not availability_index.loaded:
+            await self.db.run_sync(availability_index.load)
+        return availability_index
+
+    async def get_available_rooms(self, start_date: datetime, end_date: datetime):
+        """Returns a list of Room objects that are free."""
+        index = await self._index()
+        if index is not None:
+            rooms = (await self.db.scalars(select(Room))).all()
+            free_ids = set(index.available_room_ids(start_date, end_date, [r.id for r in rooms]))
+            return [r for r in rooms if r.id in free_ids]
+
+        result = await self.db.scalars(
+            select(Room).where(~overlap_exists(Room.id, start_date, end_date)).order_by(Room.id)
+        )
+        return result.all()
+
+    async def get_room_by_number(self, room_number: str):
+        return await self.db.scalar(select(Room).where(Room.room_number == room_number))
+
+    async def is_room_available(self, room_id: int, start_date: datetime, end_date: datetime) -> bool:
+        index = await self._index()
+        if index is not None:
+            return index.is_available(room_id, start_date, end_date)
+
+        return not await self.has_overlapping_booking(room_id, start_date, end_date)
+
+    async def has_overlapping_booking(self, room_id: int, start_date: datetime, end_date: datetime) -> bool:
+        return await self.db.scalar(select(overlap_exists(room_id, start_date, end_date)))
+
+    async def lock_room_for_booking(self, room_id: int):
+        """See BookingRepository.lock_room_for_booking."""
+        await self.lock_rooms_for_booking([room_id])
+
+    async def lock_rooms_for_booking(self, room_ids: Sequence[int]):
+        conn = await self.db.connection()
+        if conn.dialect.name == "sqlite":
+            raw = await conn.get_raw_connection()
+            if not raw.driver_connection.in_transaction:
+                await conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            await self.db.execute(
+                select(Room.id).where(Room.id.in_(room_ids)).order_by(Room.id).with_for_update()
+            )
+
+    async def conflicting_room_ids(self, stays: Sequence[Stay]) -> Set[int]:
+        result = await self.db.scalars(select(Booking.room_id).where(overlaps_any(stays)).distinct())
+        return set(result.all())
+
+    async def reserve_room(self, room_id: int, name: str, email: str, start: datetime, end: datetime,
+                           adults: int, children: int, outbox: Sequence[EmailOutbox] = ()):
+        """
+        Re-checks the room and writes guest + booking in one short transaction.
+        `outbox` rows (e.g. the confirmation email) are committed with the booking.
+        Returns the new Booking, or None if the room is taken for these dates.
+        """
+        index = await self._index()
+        if index is not None and not index.is_available(room_id, start, end):
+            return None
+
+        try:
+            await self.lock_room_for_booking(room_id)
+            if await self.has_overlapping_booking(room_id, start, end):
+                await self.db.rollback()
+                return None
+
+            guest = await self.get_or_create_guest(name, email)
+            booking = Booking(
+                room_id=room_id,
+                guest_id=guest.id,
+                check_in_date=start,
+                check_out_date=end,
+                adults=adults,
+                children=children,
+                status="confirmed"
+            )
+            self.db.add(booking)
+            self.db.add_all(outbox)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        after_booking_commit(room_id, start, end)
+        return booking
+
+    async def reserve_rooms(self, name: str, email: str, stays: Sequence[Stay],
+                            outbox: Sequence[EmailOutbox] = ()) -> Tuple[List[int], Set[int]]:
+        """See BookingRepository.reserve_rooms."""
+        index = await self._index()
+        if index is not None:
+            taken = {s.room_id for s in stays if not index.is_available(s.room_id, s.start, s.end)}
+            if taken:
+                return [], taken
+
+        try:
+            await self.lock_rooms_for_booking(sorted({s.room_id for s in stays}))
+            taken = await self.conflicting_room_ids(stays)
+            if taken:
+                await self.db.rollback()
+                return [], taken
+
+            guest = await self.get_or_create_guest(name, email)
+            result = await self.db.scalars(insert(Booking).returning(Booking.id), booking_rows(guest.id, stays))
+            booking_ids = list(result)
+            self.db.add_all(outbox)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        for s in stays:
+            after_booking_commit(s.room_id, s.start, s.end)
+        return booking_ids, set()
+
+    async def get_rooms_by_number(self, room_numbers: Sequence[str]):
+        return (await self.db.scalars(select(Room).where(Room.room_number.in_(room_numbers)))).all()
+
+    async def get_guest_by_email(self, email: str):
+        return await self.db.scalar(select(Guest).where(Guest.email == email))
+
+    async def get_or_create_guest(self, name: str, email: str):
+        """Guest upsert for use inside an open transaction."""
+        guest = await self.get_guest_by_email(email)
+        if guest:
+            return guest
+        try:
+            async with self.db.begin_nested():
+                guest = Guest(name=name, email=email, phone="N/A")
+                self.db.add(guest)
+            return guest
+        except IntegrityError:
+            return await self.get_guest_by_email(email)
@@ -0,0 +1,97 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+from app.db.models import Booking, Room
+
+
+class _RoomIntervals:
+    """Disjoint, sorted [start, end) intervals for one room.
+
+    Overlapping or touching stays are merged on insert, so an overlap
+    question is a single bisect on `starts` plus one comparison.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self):
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        # Last interval that begins before the requested check-out
+        i = bisect_left(self.starts, end)
+        return i > 0 and self.ends[i - 1] > start
+
+    def add(self, start: datetime, end: datetime):
+        # Every interval in [lo, hi) touches the new one and gets merged into it
+        lo = bisect_left(self.ends, start)
+        hi = bisect_right(self.starts, end)
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+
+
+class AvailabilityIndex:
+    """
+    In-memory per-room interval index of bookings.
+
+    Loaded once from the database, then kept current by
+    `BookingRepository.create_booking`. Each worker process holds its own
+    copy, so the database stays the source of truth for writes.
+    """
+
+    def __init__(self):
+        self._rooms: Dict[int, _RoomIntervals] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self, db: Session):
+        """(Re)builds the index from the rooms and bookings tables."""
+        rooms: Dict[int, _RoomIntervals] = {room_id: _RoomIntervals() for (room_id,) in db.query(Room.id)}
+        rows = db.query(Booking.room_id, Booking.check_in_date, Booking.check_out_date).filter(
+            Booking.check_out_date.isnot(None)
+        ).order_by(Booking.room_id, Booking.check_in_date)
+        for room_id, start, end in rows:
+            rooms.setdefault(room_id, _RoomIntervals()).add(start, end)
+
+        with self._lock:
+            self._rooms = rooms
+            self.loaded = True
+
+    def ensure_loaded(self, db: Session):
+        if not self.loaded:
+            self.load(db)
+
+    def add_booking(self, room_id: int, start: datetime, end: datetime):
+        if not self.loaded:
+            return
+        with self._lock:
+            self._rooms.setdefault(room_id, _RoomIntervals()).add(start, end)
+
+    def is_available(self, room_id: int, start: datetime, end: datetime) -> bool:
+        with self._lock:
+            intervals = self._rooms.get(room_id)
+            return intervals is None or not intervals.overlaps(start, end)
+
+    def available_room_ids(self, start: datetime, end: datetime, room_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """Returns the ids of rooms with no stay overlapping [start, end)."""
+        with self._lock:
+            candidates = self._rooms.keys() if room_ids is None else room_ids
+            return [
+                room_id for room_id in candidates
+                if room_id not in self._rooms or not self._rooms[room_id].overlaps(start, end)
+            ]
+
+    def clear(self):
+        with self._lock:
+            self._rooms = {}
+            self.loaded = False
+
+
+# Process-wide instance (only used when settings.AVAILABILITY_INDEX_ENABLED)
+availability_index = AvailabilityIndex()
@@ -1,12 +1,69 @@
-from sqlalchemy.orm import Session
-from app.db.models import Booking, Room, Guest
+from sqlalchemy import and_, exists, insert, or_, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from app.core.config import settings
+from app.db.models import Booking, Room, Guest, EmailOutbox
+from app.db.repositories.availability_index import availability_index
+from app.services.availability_cache import availability_cache
+from app.services.data_version import bookings_version
 from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence, Set, Tuple
+
+
+class Stay(NamedTuple):
+    """One room of a block booking."""
+    room_id: int
+    start: datetime
+    end: datetime
+    adults: int = 1
+    children: int = 0
+
+
+def overlap_exists(room_id, start_date: datetime, end_date: datetime):
+    """EXISTS (a booking of room_id overlapping the dates), served by ix_bookings_room_dates."""
+    return exists().where(and_(
+        Booking.room_id == room_id,
+        Booking.check_in_date < end_date,
+        Booking.check_out_date > start_date
+    ))
+
+
+def overlaps_any(stays: Sequence[Stay]):
+    """OR of per-stay overlap predicates: one ix_bookings_room_dates range probe per requested room."""
+    return or_(*(
+        and_(Booking.room_id == s.room_id, Booking.check_in_date < s.end, Booking.check_out_date > s.start)
+        for s in stays
+    ))
+
+
+def booking_rows(guest_id: int, stays: Sequence[Stay]) -> List[dict]:
+    return [
+        {"room_id": s.room_id, "guest_id": guest_id, "check_in_date": s.start, "check_out_date": s.end,
+         "adults": s.adults, "children": s.children, "status": "confirmed"}
+        for s in stays
+    ]
+
+
+def after_booking_commit(room_id: int, start: datetime, end: datetime):
+    """Keeps in-process derived state in step with a committed booking."""
+    bookings_version.bump()
+    if settings.AVAILABILITY_INDEX_ENABLED:
+        availability_index.add_booking(room_id, start, end)
+    if settings.AVAILABILITY_CACHE_ENABLED:
+        availability_cache.invalidate_range(start, end)
 
 
 class BookingRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def _index(self):
+        """Returns the loaded availability index, or None when it is disabled."""
+        if not settings.AVAILABILITY_INDEX_ENABLED:
+            return None
+        availability_index.ensure_loaded(self.db)
+        return availability_index
+
     def get_overlapping_bookings(self, start_date: datetime, end_date: datetime):
         """Finds any booking that conflicts with the requested dates."""
         return self.db.query(Booking).filter(
@@ -16,15 +73,119 @@ class BookingRepository:
 
     def get_available_rooms(self, start_date: datetime, end_date: datetime):
         """Returns a list of Room objects that are free."""
-        # 1. Find bad rooms
-        overlapping = self.get_overlapping_bookings(start_date, end_date)
-        booked_ids = [b.room_id for b in overlapping]
+        index = self._index()
+        if index is not None:
+            rooms = self.db.query(Room).all()
+            free_ids = set(index.available_room_ids(start_date, end_date, [r.id for r in rooms]))
+            return [r for r in rooms if r.id in free_ids]
+
+        # One round trip: rooms WHERE NOT EXISTS (an overlapping booking for that room)
+        return self.db.query(Room).filter(
+            ~overlap_exists(Room.id, start_date, end_date)
+        ).order_by(Room.id).all()
+
+    def is_room_available(self, room_id: int, start_date: datetime, end_date: datetime) -> bool:
+        """True if no booking for this room overlaps the requested dates."""
+        index = self._index()
+        if index is not None:
+            return index.is_available(room_id, start_date, end_date)
+
+        return not self.has_overlapping_booking(room_id, start_date, end_date)
+
+    def has_overlapping_booking(self, room_id: int, start_date: datetime, end_date: datetime) -> bool:
+        """Indexed conflict probe for a single room (always hits the database)."""
+        return self.db.query(overlap_exists(room_id, start_date, end_date)).scalar()
+
+    def lock_room_for_booking(self, room_id: int):
+        """
+        Takes the write lock that serializes bookings for this room.
 
-        # 2. Return good rooms (NOT IN bad list)
-        return self.db.query(Room).filter(Room.id.notin_(booked_ids)).all()
+        SQLite: BEGIN IMMEDIATE grabs the database write lock up front, so two
+        writers cannot both pass the conflict check. Server databases: a
+        SELECT ... FOR UPDATE on the room row only blocks bookings of the same room.
+        """
+        self.lock_rooms_for_booking([room_id])
 
-    def create_booking(self, room_id: int, guest_id: int, start: datetime, end: datetime, adults: int, children: int):
-        """Creates and saves a new booking."""
+    def lock_rooms_for_booking(self, room_ids: Sequence[int]):
+        """Same as lock_room_for_booking for several rooms (row locks taken in id order to avoid deadlocks)."""
+        conn = self.db.connection()
+        if conn.dialect.name == "sqlite":
+            # If this connection already wrote something it holds the write lock anyway
+            if not conn.connection.driver_connection.in_transaction:
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            self.db.query(Room.id).filter(Room.id.in_(room_ids)).order_by(Room.id).with_for_update().all()
+
+    def conflicting_room_ids(self, stays: Sequence[Stay]) -> Set[int]:
+        """Rooms (of `stays`) that already have a booking overlapping the requested dates, in one query."""
+        rows = self.db.query(Booking.room_id).filter(overlaps_any(stays)).distinct().all()
+        return {room_id for (room_id,) in rows}
+
+    def reserve_room(self, room_id: int, name: str, email: str, start: datetime, end: datetime,
+                     adults: int, children: int, outbox: Sequence[EmailOutbox] = ()):
+        """
+        Re-checks the room and writes guest + booking in one short transaction.
+        `outbox` rows (e.g. the confirmation email) are committed with the booking.
+        Returns the new Booking, or None if the room is taken for these dates.
+        """
+        # Cheap early reject from the in-memory index; the locked check below is authoritative
+        index = self._index()
+        if index is not None and not index.is_available(room_id, start, end):
+            return None
+
+        try:
+            self.lock_room_for_booking(room_id)
+            if self.has_overlapping_booking(room_id, start, end):
+                self.db.rollback()
+                return None
+
+            guest = self.get_or_create_guest(name, email)
+            booking = self.create_booking(room_id, guest.id, start, end, adults, children, commit=False)
+            self.db.add_all(outbox)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        after_booking_commit(room_id, start, end)
+        return booking
+
+    def reserve_rooms(self, name: str, email: str, stays: Sequence[Stay],
+                      outbox: Sequence[EmailOutbox] = ()) -> Tuple[List[int], Set[int]]:
+        """
+        Block booking, all or nothing: one lock, one conflict query, one guest
+        upsert and one commit for every stay (plus `outbox` rows).
+        Returns (new booking ids, set()) or ([], ids of the rooms that are taken).
+        """
+        index = self._index()
+        if index is not None:
+            taken = {s.room_id for s in stays if not index.is_available(s.room_id, s.start, s.end)}
+            if taken:
+                return [], taken
+
+        try:
+            self.lock_rooms_for_booking(sorted({s.room_id for s in stays}))
+            taken = self.conflicting_room_ids(stays)
+            if taken:
+                self.db.rollback()
+                return [], taken
+
+            guest = self.get_or_create_guest(name, email)
+            # One multi-row INSERT ... RETURNING id (ORM add_all would insert row by row on SQLite)
+            booking_ids = list(self.db.scalars(insert(Booking).returning(Booking.id), booking_rows(guest.id, stays)))
+            self.db.add_all(outbox)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        for s in stays:
+            after_booking_commit(s.room_id, s.start, s.end)
+        return booking_ids, set()
+
+    def create_booking(self, room_id: int, guest_id: int, start: datetime, end: datetime, adults: int, children: int,
+                       commit: bool = True):
+        """Creates and saves a new booking (only flushed when commit=False)."""
         new_booking = Booking(
             room_id=room_id,
             guest_id=guest_id,
@@ -35,16 +196,67 @@ class BookingRepository:
             status="confirmed"
         )
         self.db.add(new_booking)
+        if not commit:
+            self.db.flush()
+            return new_booking
+
         self.db.commit()
         self.db.refresh(new_booking)
+        after_booking_commit(room_id, start, end)
         return new_booking
 
+    def list_bookings(self, limit: int, after: Optional[Tuple[datetime, int]] = None,
+                      date_from: Optional[datetime] = None, date_to: Optional[datetime] = None,
+                      status: Optional[str] = None, room_type: Optional[str] = None,
+                      room_number: Optional[str] = None):
+        """
+        One page of bookings in (check_in_date, id) order, starting after the
+        `after` key (keyset pagination: no OFFSET, page N costs the same as
+        page 1). Room and guest come from the same query.
+        Dates: stays that haven't checked out before `date_from` and check in before `date_to`.
+        """
+        query = self.db.query(Booking).join(Booking.room).options(
+            contains_eager(Booking.room), joinedload(Booking.guest)
+        )
+        if date_from is not None:
+            query = query.filter(Booking.check_out_date >= date_from)
+        if date_to is not None:
+            query = query.filter(Booking.check_in_date < date_to)
+        if status:
+            query = query.filter(Booking.status == status)
+        if room_type:
+            query = query.filter(Room.room_type == room_type)
+        if room_number:
+            query = query.filter(Room.room_number == room_number)
+        if after is not None:
+            query = query.filter(tuple_(Booking.check_in_date, Booking.id) > tuple_(*after))
+        return query.order_by(Booking.check_in_date, Booking.id).limit(limit).all()
+
+    def get_rooms_by_number(self, room_numbers: Sequence[str]):
+        return self.db.query(Room).filter(Room.room_number.in_(room_numbers)).all()
+
     def get_guest_by_email(self, email: str):
         return self.db.query(Guest).filter(Guest.email == email).first()
 
-    def create_guest(self, name: str, email: str):
+    def create_guest(self, name: str, email: str, commit: bool = True):
         guest = Guest(name=name, email=email, phone="N/A")
         self.db.add(guest)
+        if not commit:
+            self.db.flush()
+            return guest
+
         self.db.commit()
         self.db.refresh(guest)
-        return guest
\ No newline at end of file
+        return guest
+
+    def get_or_create_guest(self, name: str, email: str):
+        """Guest upsert for use inside an open transaction."""
+        guest = self.get_guest_by_email(email)
+        if guest:
+            return guest
+        try:
+            with self.db.begin_nested():
+                return self.create_guest(name, email, commit=False)
+        except IntegrityError:
+            # Another booking created the same guest concurrently
+            return self.get_guest_by_email(email)
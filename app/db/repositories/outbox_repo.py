@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import EmailOutbox
+
+
+def outbox_message(to_email: str, subject: str, body: str) -> EmailOutbox:
+    """A pending outbox row; add it to the session of the transaction that should send it."""
+    return EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.utcnow(),
+    )
+
+
+class OutboxRepository:
+    """Worker-side access to email_outbox: claim due messages, record the outcome."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim_due(self, limit: int, lease_seconds: float) -> List[tuple]:
+        """
+        Leases up to `limit` due messages and returns them as
+        (id, to_email, subject, body, attempts) tuples.
+
+        Claimed rows move to "sending" until `now + lease_seconds`; if the
+        worker dies mid-batch they become due again after the lease.
+        """
+        now = datetime.utcnow()
+        conn = self.db.connection()
+        query = (
+            select(EmailOutbox.id, EmailOutbox.to_email, EmailOutbox.subject, EmailOutbox.body, EmailOutbox.attempts)
+            .where(EmailOutbox.status.in_(("pending", "sending")), EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(limit)
+        )
+        if conn.dialect.name == "sqlite":
+            # Take the write lock before reading, so two workers can't claim the same rows
+            if not conn.connection.driver_connection.in_transaction:
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            query = query.with_for_update(skip_locked=True)
+
+        try:
+            rows = [tuple(r) for r in self.db.execute(query).all()]
+            if rows:
+                self.db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_([r[0] for r in rows]))
+                    .values(status="sending", next_attempt_at=now + timedelta(seconds=lease_seconds))
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return rows
+
+    def mark_sent(self, ids: List[int]):
+        if not ids:
+            return
+        self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(ids))
+            .values(status="sent", sent_at=datetime.utcnow(), last_error=None)
+        )
+        self.db.commit()
+
+    def mark_failed(self, message_id: int, attempts: int, error: str, retry_at: datetime = None):
+        """Records a failed attempt; with no `retry_at` the message is given up on."""
+        self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == message_id)
+            .values(
+                status="pending" if retry_at else "failed",
+                attempts=attempts,
+                next_attempt_at=retry_at or datetime.utcnow(),
+                last_error=error[:500],
+            )
+        )
+        self.db.commit()
+
+    def counts(self) -> dict:
+        """Messages per status, e.g. {"pending": 3, "sent": 120}."""
+        rows = self.db.execute(select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)).all()
+        return {status: count for status, count in rows}
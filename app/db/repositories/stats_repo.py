@@ -0,0 +1,63 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import and_, func, case
+from sqlalchemy.orm import Session
+
+from app.db.models import Booking, Guest, Room
+
+
+class StatsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def occupancy_by_room_type(self, day: date):
+        """
+        One GROUP BY over rooms LEFT JOIN bookings for the night of `day`.
+        Returns rows of (room_type, rooms, occupied, revenue, guests).
+        """
+        night_start = datetime.combine(day, time.min)
+        night_end = night_start + timedelta(days=1)
+
+        in_house = and_(
+            Booking.room_id == Room.id,
+            Booking.check_in_date < night_end,
+            Booking.check_out_date > night_start,
+        )
+        query = (
+            self.db.query(
+                Room.room_type,
+                func.count(func.distinct(Room.id)).label("rooms"),
+                func.count(func.distinct(Booking.room_id)).label("occupied"),
+                func.coalesce(func.sum(case((Booking.id.isnot(None), Room.price), else_=0)), 0).label("revenue"),
+                func.coalesce(func.sum(Booking.adults + Booking.children), 0).label("guests"),
+            )
+            .outerjoin(Booking, in_house)
+            .group_by(Room.room_type)
+            .order_by(Room.room_type)
+        )
+        return query.all()
+
+    def daily_movements(self, day: date, batch_size: int = 500):
+        """
+        Streams the bookings touching `day` (arriving, in-house or departing) as
+        (id, room_number, guest_name, check_in_date, check_out_date) rows, ordered by room.
+        Rows are fetched `batch_size` at a time, so memory stays flat.
+        """
+        day_start = datetime.combine(day, time.min)
+        day_end = day_start + timedelta(days=1)
+
+        query = (
+            self.db.query(
+                Booking.id,
+                Room.room_number,
+                Guest.name,
+                Booking.check_in_date,
+                Booking.check_out_date,
+            )
+            .join(Room, Booking.room_id == Room.id)
+            .outerjoin(Guest, Booking.guest_id == Guest.id)
+            .filter(Booking.check_in_date < day_end, Booking.check_out_date >= day_start)
+            .order_by(Room.room_number, Booking.check_in_date)
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(query)
@@ -1,11 +1,58 @@
 # app/db/session.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings  # <--- NEW IMPORT
 
-engine = create_engine(
-    settings.DATABASE_URL,  # <--- USES CONFIG
-    connect_args={"check_same_thread": False}
-)
+
+def resolve_engine_profile(url: str) -> str:
+    """'sqlite' or 'server', from DB_ENGINE_PROFILE or (when 'auto') the URL dialect."""
+    profile = settings.DB_ENGINE_PROFILE.lower()
+    if profile != "auto":
+        return profile
+    return "sqlite" if make_url(url).get_backend_name() == "sqlite" else "server"
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Runs on every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.close()
+
+
+def build_engine(url: str = None):
+    """Creates an engine tuned for the selected profile."""
+    url = url or settings.DATABASE_URL
+
+    if resolve_engine_profile(url) == "sqlite":
+        # SQLite: one file, WAL lets readers run alongside the single writer
+        engine = create_engine(
+            url,
+            echo=settings.DB_ECHO,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
+        )
+        event.listen(engine, "connect", set_sqlite_pragmas)
+        return engine
+
+    # Server database (e.g. postgresql+psycopg2://...): pooled connections
+    return create_engine(
+        url,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+engine = build_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
@@ -0,0 +1,139 @@
+from datetime import date, datetime, time
+
+import numpy as np
+from sqlalchemy import String, func, select
+from sqlalchemy.orm import Session
+
+from app.db.models import Booking, Room
+
+MAX_WINDOW_DAYS = 731
+
+
+class AnalyticsService:
+    """
+    Occupancy and revenue curves over a date window.
+
+    Bookings overlapping the window are loaded once into NumPy arrays; each
+    stay becomes a +1 on its first night and a -1 after its last, so one
+    bincount + cumsum gives every night's figures, overall and per room type.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _load_rooms(self):
+        rows = self.db.execute(select(Room.id, Room.room_type, Room.price).order_by(Room.id)).all()
+        room_ids = np.array([r[0] for r in rows], dtype=np.int64)
+        prices = np.array([r[2] or 0.0 for r in rows], dtype=np.float64)
+        type_names, type_codes = np.unique(np.array([r[1] or "Unknown" for r in rows], dtype=object), return_inverse=True)
+        return room_ids, prices, type_names, type_codes
+
+    def _load_stays(self, start: date, end: date):
+        """Returns (room_id, first_night, checkout_day) arrays for stays overlapping [start, end)."""
+        window_start = datetime.combine(start, time.min)
+        window_end = datetime.combine(end, time.min)
+        # DATE() (SQLite/Postgres/MySQL) returns the day only, so no per-row datetime parsing in Python.
+        # The columns need no result processing either, so rows are read straight off the DBAPI cursor.
+        result = self.db.connection().execute(
+            select(
+                Booking.room_id,
+                func.date(Booking.check_in_date, type_=String),
+                func.date(Booking.check_out_date, type_=String),
+            ).where(
+                Booking.check_in_date < window_end,
+                Booking.check_out_date > window_start,
+            )
+        )
+        rows = result.cursor.fetchall()
+        result.close()
+        if not rows:
+            empty = np.array([], dtype="datetime64[D]")
+            return np.array([], dtype=np.int64), empty, empty
+
+        room_ids, check_ins, check_outs = zip(*rows)
+        return (
+            np.fromiter(room_ids, dtype=np.int64, count=len(rows)),
+            np.array(check_ins, dtype="datetime64[D]"),
+            np.array(check_outs, dtype="datetime64[D]"),
+        )
+
+    def occupancy_report(self, start: date, end: date, include_nights: bool = True) -> dict:
+        """Per-night occupancy, ADR, RevPAR and revenue by room type for the nights in [start, end)."""
+        n_days = (end - start).days
+        if n_days <= 0:
+            raise ValueError("end must be after start")
+        if n_days > MAX_WINDOW_DAYS:
+            raise ValueError(f"window is limited to {MAX_WINDOW_DAYS} days")
+
+        room_ids, prices, type_names, type_codes = self._load_rooms()
+        total_rooms = len(room_ids)
+        n_types = len(type_names)
+
+        stay_rooms, check_ins, check_outs = self._load_stays(start, end)
+
+        # Map booking.room_id -> position in the rooms arrays (bookings of deleted rooms are skipped)
+        if total_rooms:
+            pos = np.clip(np.searchsorted(room_ids, stay_rooms), 0, total_rooms - 1)
+            known = room_ids[pos] == stay_rooms
+        else:
+            pos = np.zeros(len(stay_rooms), dtype=np.int64)
+            known = np.zeros(len(stay_rooms), dtype=bool)
+        pos, check_ins, check_outs = pos[known], check_ins[known], check_outs[known]
+
+        # Night offsets inside the window; the +1/-1 slots live in [0, n_days]
+        origin = np.datetime64(start, "D")
+        first = np.clip((check_ins - origin).astype(np.int64), 0, n_days)
+        last = np.clip((check_outs - origin).astype(np.int64), 0, n_days)
+
+        width = n_days + 1
+        stay_types = type_codes[pos]
+        stay_prices = prices[pos]
+
+        def nightly(weights=None):
+            # Per-type difference arrays flattened into one bincount, then a running sum per row
+            starts = np.bincount(stay_types * width + first, weights=weights, minlength=n_types * width)
+            stops = np.bincount(stay_types * width + last, weights=weights, minlength=n_types * width)
+            return np.cumsum((starts - stops).reshape(n_types, width), axis=1)[:, :n_days]
+
+        occupied_by_type = nightly()
+        revenue_by_type = nightly(stay_prices)
+        rooms_by_type = np.bincount(type_codes, minlength=n_types)
+
+        occupied = occupied_by_type.sum(axis=0)
+        revenue = revenue_by_type.sum(axis=0)
+
+        report = {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "nights": n_days,
+            "rooms": total_rooms,
+            "totals": _kpis(occupied.sum(), revenue.sum(), total_rooms * n_days),
+            "by_room_type": [
+                {"room_type": str(type_names[t]), "rooms": int(rooms_by_type[t]),
+                 **_kpis(occupied_by_type[t].sum(), revenue_by_type[t].sum(), rooms_by_type[t] * n_days)}
+                for t in range(n_types)
+            ],
+        }
+        if include_nights:
+            days = np.arange(origin, origin + n_days, dtype="datetime64[D]").astype(str).tolist()
+            rate = occupied / total_rooms if total_rooms else np.zeros(n_days)
+            report["by_night"] = [
+                {"date": d, "occupied": int(o), "occupancy": round(float(r), 4), "revenue": round(float(v), 2)}
+                for d, o, r, v in zip(days, occupied, rate, revenue)
+            ]
+        return report
+
+
+def _kpis(room_nights_sold, revenue, room_nights_available) -> dict:
+    """Occupancy, ADR (revenue per sold night) and RevPAR (revenue per available night)."""
+    sold = int(room_nights_sold)
+    available = int(room_nights_available)
+    revenue = float(revenue)
+    return {
+        "room_nights_sold": sold,
+        "room_nights_available": available,
+        "occupancy": round(sold / available, 4) if available else 0.0,
+        "revenue": round(revenue, 2),
+        "adr": round(revenue / sold, 2) if sold else 0.0,
+        "revpar": round(revenue / available, 2) if available else 0.0,
+    }
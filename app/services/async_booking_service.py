@@ -0,0 +1,98 @@
+import asyncio
+
+from dateutil import parser
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.async_booking_repo import AsyncBookingRepository
+from app.services.booking_service import (
+    parse_search_dates, format_available_rooms, parse_batch_stays, match_batch_rooms, batch_conflict_error,
+    batch_success,
+)
+from app.db.repositories.outbox_repo import outbox_message
+from app.services.email_service import EmailService
+from app.services.email_worker import email_worker
+from app.services.availability_cache import availability_cache
+from app.core.config import settings
+
+
+class AsyncBookingService:
+    """Async BookingService for the event loop: same rules and messages, awaitable DB calls."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = AsyncBookingRepository(db)
+        self.emailer = EmailService()
+
+    async def check_availability(self, start_str: str, end_str: str) -> str:
+        start, end, error = parse_search_dates(start_str, end_str)
+        if error:
+            return error
+
+        if settings.AVAILABILITY_CACHE_ENABLED:
+            generation = availability_cache.generation
+            cached = availability_cache.get(start, end)
+            if cached is not None:
+                return cached
+
+        response = format_available_rooms(await self.repo.get_available_rooms(start, end))
+        if settings.AVAILABILITY_CACHE_ENABLED:
+            availability_cache.put(start, end, response, generation)
+        return response
+
+    async def book_room(self, room_number: str, name: str, email: str, start_str: str, end_str: str,
+                        adults=1, children=0):
+        try:
+            start = parser.parse(start_str)
+            end = parser.parse(end_str)
+        except (ValueError, TypeError, OverflowError):
+            return "Error: Invalid date format."
+
+        # 1. Verify Room
+        room = await self.repo.get_room_by_number(room_number)
+        if not room:
+            return f"Error: Room {room_number} does not exist."
+
+        # 2. Check Capacity
+        if (int(adults) + int(children)) > room.capacity:
+            return f"Error: Room capacity exceeded (Max {room.capacity})."
+
+        # 3-6. Check this room, upsert guest, insert booking and queue the confirmation under one write lock
+        confirmation = self.emailer.guest_confirmation(name, email, room_number, start_str, end_str)
+        outbox = [outbox_message(*confirmation)] if settings.EMAIL_OUTBOX_ENABLED else []
+        booking = await self.repo.reserve_room(room.id, name, email, start, end, adults, children, outbox=outbox)
+        if booking is None:
+            return f"Error: Room {room_number} is already booked for these dates."
+
+        # 7. SEND EMAIL (the outbox worker delivers it; inline SMTP stays off the event loop)
+        if outbox:
+            email_worker.notify()
+        else:
+            await asyncio.to_thread(self.emailer.send_guest_confirmation, name, email, room_number, start_str, end_str)
+
+        return f"Success! Booking #{booking.id} confirmed. Confirmation email sent to {email}."
+
+    async def book_rooms(self, name: str, email: str, stays):
+        """See BookingService.book_rooms."""
+        requested, error = parse_batch_stays(stays)
+        if error:
+            return error
+
+        rooms = await self.repo.get_rooms_by_number(sorted({r[0] for r in requested}))
+        reservations, error = match_batch_rooms(requested, rooms)
+        if error:
+            return error
+
+        email_stays = [(number, f"{start:%Y-%m-%d}", f"{end:%Y-%m-%d}") for number, start, end, *_ in requested]
+        confirmation = self.emailer.group_confirmation(name, email, email_stays)
+        outbox = [outbox_message(*confirmation)] if settings.EMAIL_OUTBOX_ENABLED else []
+        room_numbers = {r.id: r.room_number for r in rooms}  # read now: a conflict rollback expires `rooms`
+        booking_ids, taken = await self.repo.reserve_rooms(name, email, reservations, outbox=outbox)
+        if taken:
+            return batch_conflict_error(taken, room_numbers)
+
+        if outbox:
+            email_worker.notify()
+        else:
+            await asyncio.to_thread(self.emailer.send_group_confirmation, name, email, email_stays)
+
+        return batch_success(booking_ids, email)
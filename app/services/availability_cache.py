@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+from app.core.config import settings
+
+
+class AvailabilityCache:
+    """
+    Process-wide cache of formatted `check_availability` answers, keyed on the
+    parsed (check-in, check-out) range.
+
+    A committed booking evicts only the cached ranges that overlap its stay.
+    Entries also expire after `ttl_seconds`, which bounds staleness from
+    bookings made by other worker processes.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # (start, end) -> (stored_at, text)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # dropped for capacity or age
+        self.invalidations = 0  # dropped because a booking overlapped them
+        # Bumped by every invalidation; put() refuses answers computed before the latest one
+        self.generation = 0
+
+    def get(self, start: datetime, end: datetime) -> Optional[str]:
+        key = (start, end)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, start: datetime, end: datetime, text: str, generation: int):
+        """Stores an answer computed when `self.generation` was `generation`."""
+        with self._lock:
+            if generation != self.generation:
+                return  # a booking landed while we were querying; this answer may be stale
+            self._entries[(start, end)] = (time.monotonic(), text)
+            self._entries.move_to_end((start, end))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_range(self, start: datetime, end: datetime):
+        """Evicts every cached range that overlaps the booked stay [start, end)."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] < end and key[1] > start]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            self.generation += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self.generation += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+availability_cache = AvailabilityCache(
+    max_entries=settings.AVAILABILITY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AVAILABILITY_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,86 @@
+import base64
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import Booking
+from app.db.repositories.booking_repo import BookingRepository
+
+
+@dataclass
+class BookingPage:
+    items: List[Booking]  # room and guest already loaded
+    next_cursor: Optional[str]  # None on the last page
+
+
+# The cursor is the (check_in_date, id) of the last row, opaque to clients
+def encode_cursor(booking: Booking) -> str:
+    raw = f"{booking.check_in_date.isoformat()}|{booking.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        check_in, booking_id = raw.split("|")
+        return datetime.fromisoformat(check_in), int(booking_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor. Use the next_cursor value of the previous page.")
+
+
+def stay_status(booking: Booking, today: date) -> str:
+    check_in, check_out = booking.check_in_date.date(), booking.check_out_date.date()
+    if check_in <= today < check_out:
+        return "In-House"
+    if check_in > today:
+        return "Upcoming"
+    if check_out == today:
+        return "Departing Today"
+    return "Past"
+
+
+def booking_to_dict(booking: Booking, today: date) -> dict:
+    return {
+        "id": booking.id,
+        "room_number": booking.room.room_number,
+        "room_type": booking.room.room_type,
+        "guest_name": booking.guest.name if booking.guest else None,
+        "guest_email": booking.guest.email if booking.guest else None,
+        "check_in_date": booking.check_in_date.date().isoformat(),
+        "check_out_date": booking.check_out_date.date().isoformat(),
+        "adults": booking.adults,
+        "children": booking.children,
+        "status": booking.status,
+        "stay": stay_status(booking, today),
+    }
+
+
+class BookingListService:
+    """Manager's booking list: filtered, keyset-paginated, one query per page."""
+
+    def __init__(self, db: Session):
+        self.repo = BookingRepository(db)
+
+    def page(self, limit: int = None, cursor: Optional[str] = None, status: Optional[str] = None,
+             room_type: Optional[str] = None, room_number: Optional[str] = None,
+             start: Optional[date] = None, end: Optional[date] = None, include_past: bool = False) -> BookingPage:
+        """
+        Bookings in check-in order. Without `start`, only active and upcoming
+        stays are listed unless `include_past`. Raises ValueError for a bad cursor.
+        """
+        limit = max(1, min(limit or settings.BOOKING_PAGE_SIZE, settings.BOOKING_PAGE_MAX))
+        after = decode_cursor(cursor) if cursor else None
+
+        if start is None and not include_past:
+            start = datetime.now().date()
+        date_from = datetime.combine(start, datetime.min.time()) if start else None
+        date_to = datetime.combine(end, datetime.min.time()) if end else None
+
+        # One extra row tells whether there is a next page, without a COUNT
+        rows = self.repo.list_bookings(limit + 1, after, date_from, date_to, status, room_type, room_number)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return BookingPage(rows, encode_cursor(rows[-1]) if has_more else None)
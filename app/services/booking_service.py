@@ -1,46 +1,137 @@
 from sqlalchemy.orm import Session
-from app.db.repositories.booking_repo import BookingRepository
+from app.db.repositories.booking_repo import BookingRepository, Stay
 from app.db.models import Room
+from app.db.repositories.outbox_repo import outbox_message
 from app.services.email_service import EmailService
+from app.services.email_worker import email_worker
+from app.services.availability_cache import availability_cache
+from app.core.config import settings
 from dateutil import parser
 from datetime import datetime
 
 
-class BookingService:
-    def __init__(self, db: Session):
-        self.db = db
-        self.repo = BookingRepository(db)
-        self.emailer = EmailService()  # <--- INITIALIZED
+# Shared by BookingService and AsyncBookingService
+def parse_date(value: str) -> datetime:
+    """ISO dates (what the tools are told to send) skip dateutil's slower general parser."""
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return parser.parse(value)
 
-    def check_availability(self, start_str: str, end_str: str) -> str:
-        try:
-            start = parser.parse(start_str)
-            end = parser.parse(end_str)
-        except (ValueError, TypeError):
-            return "Error: Invalid date format. Please use YYYY-MM-DD."
 
+def parse_search_dates(start_str: str, end_str: str):
+    """Returns (start, end, None) for a valid future stay, else (None, None, error message)."""
+    try:
+        start = parse_date(start_str)
+        end = parse_date(end_str)
+    except (ValueError, TypeError, OverflowError):
+        return None, None, "Error: Invalid date format. Please use YYYY-MM-DD."
+
+    # We compare the "date" part only (ignoring time)
+    if start.date() < datetime.now().date():
+        return None, None, f"Error: You cannot book dates in the past. Today is {datetime.now().strftime('%Y-%m-%d')}."
 
-        # We compare the "date" part only (ignoring time)
-        if start.date() < datetime.now().date():
-            return f"Error: You cannot book dates in the past. Today is {datetime.now().strftime('%Y-%m-%d')}."
+    # 🛑 NEW RULE: End date must be after Start date
+    if end <= start:
+        return None, None, "Error: Check-out date must be after Check-in date."
 
-        # 🛑 NEW RULE: End date must be after Start date
+    return start, end, None
+
+
+def format_available_rooms(available_rooms) -> str:
+    if not available_rooms:
+        return "No rooms available for these dates."
+
+    response = ["Available Rooms:"]
+    for room in available_rooms:
+        response.append(
+            f"- Room {room.room_number} ({room.room_type}): Rs. {room.price} | {room.description}"
+        )
+
+    return "\n".join(response)
+
+
+def parse_batch_stays(stays):
+    """
+    Validates a block booking request (dicts with room_number, start_date,
+    end_date, adults, children). Returns (requested, None) or (None, error);
+    `requested` is [(room_number, start, end, adults, children), ...].
+    """
+    if not stays:
+        return None, "Error: No rooms requested."
+    if len(stays) > settings.BATCH_BOOKING_MAX_ROOMS:
+        return None, f"Error: A batch can book at most {settings.BATCH_BOOKING_MAX_ROOMS} rooms."
+
+    requested = []
+    for item in stays:
+        room_number = str(item["room_number"])
+        try:
+            start = parse_date(item["start_date"])
+            end = parse_date(item["end_date"])
+        except (ValueError, TypeError, OverflowError):
+            return None, f"Error: Invalid date format for Room {room_number}."
         if end <= start:
-            return "Error: Check-out date must be after Check-in date."
+            return None, f"Error: Check-out date must be after Check-in date (Room {room_number})."
+        requested.append((room_number, start, end, int(item.get("adults", 1)), int(item.get("children", 0))))
+
+    # The same room twice in one request must not overlap itself
+    ordered = sorted(requested, key=lambda r: (r[0], r[1]))
+    for prev, cur in zip(ordered, ordered[1:]):
+        if prev[0] == cur[0] and cur[1] < prev[2]:
+            return None, f"Error: Room {cur[0]} is requested twice for overlapping dates."
+    return requested, None
 
-        # ... Existing Logic (Database Query) ...
-        available_rooms = self.repo.get_available_rooms(start, end)
 
-        if not available_rooms:
-            return "No rooms available for these dates."
+def match_batch_rooms(requested, rooms):
+    """Maps the requested room numbers onto Room rows. Returns (stays, None) or (None, error)."""
+    by_number = {r.room_number: r for r in rooms}
+    missing = sorted({number for number, *_ in requested if number not in by_number})
+    if missing:
+        return None, f"Error: Room(s) {', '.join(missing)} do not exist."
 
-        response = ["Available Rooms:"]
-        for room in available_rooms:
-            response.append(
-                f"- Room {room.room_number} ({room.room_type}): Rs. {room.price} | {room.description}"
-            )
+    stays = []
+    for number, start, end, adults, children in requested:
+        room = by_number[number]
+        if adults + children > room.capacity:
+            return None, f"Error: Room {number} capacity exceeded (Max {room.capacity})."
+        stays.append(Stay(room.id, start, end, adults, children))
+    return stays, None
 
-        return "\n".join(response)
+
+def batch_conflict_error(taken_ids, room_numbers) -> str:
+    numbers = sorted(room_numbers[i] for i in taken_ids)
+    return f"Error: Room(s) {', '.join(numbers)} already booked for these dates. Nothing was booked."
+
+
+def batch_success(booking_ids, email: str) -> str:
+    refs = ", ".join(f"#{i}" for i in booking_ids)
+    if len(booking_ids) == 1:
+        return f"Success! 1 room booked (Booking {refs}). One group confirmation email sent to {email}."
+    return (f"Success! {len(booking_ids)} rooms booked (Bookings {refs}). "
+            f"One group confirmation email sent to {email}.")
+
+
+class BookingService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = BookingRepository(db)
+        self.emailer = EmailService()  # <--- INITIALIZED
+
+    def check_availability(self, start_str: str, end_str: str) -> str:
+        start, end, error = parse_search_dates(start_str, end_str)
+        if error:
+            return error
+
+        if settings.AVAILABILITY_CACHE_ENABLED:
+            generation = availability_cache.generation
+            cached = availability_cache.get(start, end)
+            if cached is not None:
+                return cached
+
+        response = format_available_rooms(self.repo.get_available_rooms(start, end))
+        if settings.AVAILABILITY_CACHE_ENABLED:
+            availability_cache.put(start, end, response, generation)
+        return response
 
     def book_room(self, room_number: str, name: str, email: str, start_str: str, end_str: str, adults=1, children=0):
         try:
@@ -58,22 +149,47 @@ class BookingService:
         if (int(adults) + int(children)) > room.capacity:
             return f"Error: Room capacity exceeded (Max {room.capacity})."
 
-        # 3. Double Check Availability
-        conflicts = self.repo.get_overlapping_bookings(start, end)
-        for booking in conflicts:
-            if booking.room_id == room.id:
-                return f"Error: Room {room_number} is already booked for these dates."
-
-        # 4. Handle Guest
-        guest = self.repo.get_guest_by_email(email)
-        if not guest:
-            guest = self.repo.create_guest(name, email)
-
-        # 5. Create Booking
-        booking = self.repo.create_booking(room.id, guest.id, start, end, adults, children)
-
-        # 6. SEND EMAIL
+        # 3-6. Check this room, upsert guest, insert booking and queue the confirmation under one write lock
         # ✅ ONLY send to Guest (Manager gets the Daily Report at 12 PM)
-        self.emailer.send_guest_confirmation(name, email, room_number, start_str, end_str)
-
-        return f"Success! Booking #{booking.id} confirmed. Confirmation email sent to {email}."
\ No newline at end of file
+        confirmation = self.emailer.guest_confirmation(name, email, room_number, start_str, end_str)
+        outbox = [outbox_message(*confirmation)] if settings.EMAIL_OUTBOX_ENABLED else []
+        booking = self.repo.reserve_room(room.id, name, email, start, end, adults, children, outbox=outbox)
+        if booking is None:
+            return f"Error: Room {room_number} is already booked for these dates."
+
+        # 7. SEND EMAIL (the outbox worker delivers it; inline only when the outbox is off)
+        if outbox:
+            email_worker.notify()
+        else:
+            self.emailer.send_guest_confirmation(name, email, room_number, start_str, end_str)
+
+        return f"Success! Booking #{booking.id} confirmed. Confirmation email sent to {email}."
+
+    def book_rooms(self, name: str, email: str, stays):
+        """Group / block reservation: every room or none, at about the cost of one booking."""
+        requested, error = parse_batch_stays(stays)
+        if error:
+            return error
+
+        # 1-2. Verify all rooms and capacities with one lookup
+        rooms = self.repo.get_rooms_by_number(sorted({r[0] for r in requested}))
+        reservations, error = match_batch_rooms(requested, rooms)
+        if error:
+            return error
+
+        # 3-6. One lock, one conflict query, one transaction, one grouped confirmation
+        email_stays = [(number, f"{start:%Y-%m-%d}", f"{end:%Y-%m-%d}") for number, start, end, *_ in requested]
+        confirmation = self.emailer.group_confirmation(name, email, email_stays)
+        outbox = [outbox_message(*confirmation)] if settings.EMAIL_OUTBOX_ENABLED else []
+        room_numbers = {r.id: r.room_number for r in rooms}  # read now: a conflict rollback expires `rooms`
+        booking_ids, taken = self.repo.reserve_rooms(name, email, reservations, outbox=outbox)
+        if taken:
+            return batch_conflict_error(taken, room_numbers)
+
+        # 7. SEND EMAIL
+        if outbox:
+            email_worker.notify()
+        else:
+            self.emailer.send_group_confirmation(name, email, email_stays)
+
+        return batch_success(booking_ids, email)
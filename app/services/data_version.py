@@ -0,0 +1,25 @@
+import threading
+
+
+class DataVersion:
+    """
+    Monotonic counter bumped by every committed write to a dataset.
+    Caches put it in their keys: a bump makes every older entry unreachable.
+    Per process, like the other in-process caches (pair it with a TTL).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0
+
+    @property
+    def current(self) -> int:
+        return self._value
+
+    def bump(self) -> int:
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+bookings_version = DataVersion()
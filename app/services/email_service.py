@@ -1,5 +1,6 @@
 import smtplib
 import os
+import time
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -17,38 +18,58 @@ class EmailService:
         self.smtp_server = settings.SMTP_SERVER
         self.smtp_port = settings.SMTP_PORT
 
+    @property
+    def is_configured(self) -> bool:
+        """False means MOCK MODE: messages are printed instead of sent."""
+        if not self.sender_email:
+            return False
+        return bool(self.sender_password) or not settings.SMTP_REQUIRE_AUTH
+
+    def simulate(self, to_email: str, subject: str, body: str):
+        print(f"\n{'=' * 20} 📧 EMAIL SIMULATION {'=' * 20}")
+        print(f"FROM:    {self.sender_email or 'system@grandhotel.com'}")
+        print(f"TO:      {to_email}")
+        print(f"SUBJECT: {subject}")
+        print(f"BODY:\n{body}")
+        print(f"{'=' * 58}\n")
+
+    def build_message(self, to_email: str, subject: str, body: str) -> MIMEMultipart:
+        msg = MIMEMultipart()
+        msg['From'] = self.sender_email
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+
+    def connect(self) -> smtplib.SMTP:
+        """Opens an SMTP session (STARTTLS + login when configured)."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=settings.SMTP_TIMEOUT_SECONDS)
+        if settings.SMTP_STARTTLS:
+            server.starttls()
+        if self.sender_password:
+            server.login(self.sender_email, self.sender_password)
+        return server
+
     def _send(self, to_email: str, subject: str, body: str):
         """Internal helper to send email or mock it."""
 
         # MOCK MODE
-        if not self.sender_email or not self.sender_password:
-            print(f"\n{'=' * 20} 📧 EMAIL SIMULATION {'=' * 20}")
-            print(f"FROM:    {self.sender_email or 'system@grandhotel.com'}")
-            print(f"TO:      {to_email}")
-            print(f"SUBJECT: {subject}")
-            print(f"BODY:\n{body}")
-            print(f"{'=' * 58}\n")
+        if not self.is_configured:
+            self.simulate(to_email, subject, body)
             return True
 
-        # REAL MODE
+        # REAL MODE (one-off connection; bulk senders should use SMTPConnection)
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            msg.attach(MIMEText(body, 'plain'))
-
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            server.send_message(msg)
+            server = self.connect()
+            server.send_message(self.build_message(to_email, subject, body))
             server.quit()
             return True
         except Exception as e:
             print(f"❌ Error sending email: {e}")
             return False
 
-    def send_guest_confirmation(self, name: str, email: str, room: str, start: str, end: str):
+    def guest_confirmation(self, name: str, email: str, room: str, start: str, end: str):
+        """Returns (to_email, subject, body) of the booking confirmation."""
         subject = f"✅ Booking Confirmed - Room {room}"
         body = f"""Dear {name},
 
@@ -61,7 +82,28 @@ Details:
 
 See you soon!
 Grand Hotel Concierge"""
-        return self._send(email, subject, body)
+        return email, subject, body
+
+    def group_confirmation(self, name: str, email: str, stays):
+        """One confirmation for a block booking; `stays` is [(room, start, end), ...]."""
+        subject = f"✅ Group Booking Confirmed - {len(stays)} Room{'s' if len(stays) != 1 else ''}"
+        lines = "\n".join(f"- Room {room}: {start} to {end}" for room, start, end in stays)
+        body = f"""Dear {name},
+
+We are delighted to confirm your group reservation at Grand Hotel.
+
+Rooms:
+{lines}
+
+See you soon!
+Grand Hotel Concierge"""
+        return email, subject, body
+
+    def send_guest_confirmation(self, name: str, email: str, room: str, start: str, end: str):
+        return self._send(*self.guest_confirmation(name, email, room, start, end))
+
+    def send_group_confirmation(self, name: str, email: str, stays):
+        return self._send(*self.group_confirmation(name, email, stays))
 
     def send_daily_report(self, report_content: str):
         """Sends the Daily Summary to the Manager."""
@@ -74,4 +116,53 @@ Here is the summary of bookings and occupancy:
 
 End of Report.
 Grand Hotel System"""
-        return self._send(self.manager_email, subject, body)
\ No newline at end of file
+        return self._send(self.manager_email, subject, body)
+
+
+class SMTPConnection:
+    """
+    One long-lived SMTP session shared by many messages: connect, STARTTLS
+    and login happen once instead of per email. Reopens itself if the server
+    drops it; `close_if_idle` hangs up before the server times us out.
+    """
+
+    def __init__(self, emailer: EmailService):
+        self.emailer = emailer
+        self._server = None
+        self._last_used = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._server is not None
+
+    def send(self, to_email: str, subject: str, body: str):
+        """Sends one message; raises on failure (the caller decides about retries)."""
+        msg = self.emailer.build_message(to_email, subject, body)
+        if self._server is None:
+            self._server = self.emailer.connect()
+        try:
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Server hung up on an idle connection: one retry on a fresh session
+            self._server = None
+            self._server = self.emailer.connect()
+            self._server.send_message(msg)
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            raise  # message refused, the session itself is still fine
+        except Exception:
+            self.close()
+            raise
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self, idle_seconds: float):
+        if self._server is not None and time.monotonic() - self._last_used >= idle_seconds:
+            self.close()
+
+    def close(self):
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
@@ -0,0 +1,108 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.core import metrics
+from app.db.session import SessionLocal
+from app.db.repositories.outbox_repo import OutboxRepository
+from app.services.email_service import EmailService, SMTPConnection
+
+
+class EmailWorker:
+    """
+    Background thread that drains the email_outbox table.
+
+    - Batching: claims up to EMAIL_OUTBOX_BATCH_SIZE due messages per round.
+    - Connection reuse: one SMTPConnection for every message, closed after SMTP_IDLE_SECONDS idle.
+    - Retries: a failed message is retried with exponential backoff, up to EMAIL_OUTBOX_MAX_ATTEMPTS.
+    Bookings call `notify()` after commit so the worker wakes up without waiting for the next poll.
+    """
+
+    def __init__(self):
+        self.emailer = EmailService()
+        self.connection = SMTPConnection(self.emailer)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.sent = 0
+        self.failed = 0
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Finishes the current batch, closes the SMTP connection and joins the thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def notify(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                claimed = self.drain_once()
+            except Exception as e:
+                print(f"❌ Email outbox error: {e}")
+                claimed = 0
+
+            # A full batch means more may be waiting: go again straight away
+            if claimed >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+                continue
+
+            self.connection.close_if_idle(settings.SMTP_IDLE_SECONDS)
+            self._wake.wait(settings.EMAIL_OUTBOX_POLL_SECONDS)
+            self._wake.clear()
+
+        self.connection.close()
+
+    def drain_once(self) -> int:
+        """Delivers one batch of due messages; returns how many were claimed."""
+        db = SessionLocal()
+        started = time.perf_counter()
+        try:
+            repo = OutboxRepository(db)
+            batch = repo.claim_due(settings.EMAIL_OUTBOX_BATCH_SIZE, settings.EMAIL_OUTBOX_LEASE_SECONDS)
+            if not batch:
+                return 0
+
+            delivered = []
+            for message_id, to_email, subject, body, attempts in batch:
+                try:
+                    self._deliver(to_email, subject, body)
+                    delivered.append(message_id)
+                except Exception as e:
+                    attempts = (attempts or 0) + 1
+                    retry_at = None
+                    if attempts < settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                        delay = settings.EMAIL_OUTBOX_BACKOFF_SECONDS * (2 ** (attempts - 1))
+                        retry_at = datetime.utcnow() + timedelta(seconds=delay)
+                    repo.mark_failed(message_id, attempts, str(e), retry_at)
+                    self.failed += 1
+                    metrics.JOB_ERRORS.labels("email_outbox").inc()
+                    print(f"❌ Email to {to_email} failed (attempt {attempts}): {e}")
+
+            repo.mark_sent(delivered)
+            self.sent += len(delivered)
+            metrics.JOB_SECONDS.labels("email_outbox").observe(time.perf_counter() - started)
+            return len(batch)
+        finally:
+            db.close()
+
+    def _deliver(self, to_email: str, subject: str, body: str):
+        # MOCK MODE keeps printing the simulation, now from the worker thread
+        if not self.emailer.is_configured:
+            self.emailer.simulate(to_email, subject, body)
+            return
+        self.connection.send(to_email, subject, body)
+
+
+email_worker = EmailWorker()
@@ -1,36 +1,83 @@
-from sqlalchemy.orm import Session
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func
+from app.core.config import settings
+from app.core import metrics
 from app.db.session import SessionLocal
 from app.db.models import Booking, Room
+from app.db.repositories.stats_repo import StatsRepository
 from app.services.email_service import EmailService
-from datetime import datetime
 
 
 class ReportService:
     def __init__(self):
         self.emailer = EmailService()
+        # One worker: reports run off the request/scheduler threads and never overlap
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="daily-report")
+        self._pending: Optional[Future] = None
+        self._lock = threading.Lock()
 
-    def generate_and_send(self):
-        """Generates stats and emails the manager."""
-        db = SessionLocal()
-        try:
-            # 1. Gather Stats (Simple Logic)
-            total_rooms = db.query(Room).count()
-            total_bookings = db.query(Booking).count()
+    def submit(self) -> Optional[Future]:
+        """Queues a report on the background worker and returns at once (None if one is already queued/running)."""
+        with self._lock:
+            if self._pending is not None and not self._pending.done():
+                print("⏭️ Daily Report already in progress, skipping.")
+                return None
+            try:
+                self._pending = self._executor.submit(self.generate_and_send)
+            except RuntimeError:
+                return None  # executor already shut down
+            return self._pending
 
-            # Get today's bookings
-            # (Assuming Booking has a 'created_at' or we just list all active)
-            # For MVP, we list ALL active bookings
-            bookings = db.query(Booking).all()
+    def shutdown(self, wait: bool = False):
+        """Stops the worker; a report that hasn't started yet is dropped."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
 
-            report_lines = []
-            report_lines.append(f"Total Rooms: {total_rooms}")
-            report_lines.append(f"Total Bookings: {total_bookings}")
-            report_lines.append("-" * 20)
+    def build_report(self, db, day) -> str:
+        """Counts plus one line per booking arriving, in-house or departing on `day`."""
+        total_rooms = db.query(func.count(Room.id)).scalar()
+        total_bookings = db.query(func.count(Booking.id)).scalar()
 
-            for b in bookings:
-                report_lines.append(f"• Booking #{b.id}: Room {b.room_id} | Guest {b.guest_id}")
+        report_lines = []
+        report_lines.append(f"Total Rooms: {total_rooms}")
+        report_lines.append(f"Total Bookings: {total_bookings}")
+        report_lines.append("-" * 20)
 
-            final_report = "\n".join(report_lines)
+        listed = 0
+        hidden = 0
+        for b in StatsRepository(db).daily_movements(day, batch_size=settings.REPORT_BATCH_SIZE):
+            if listed >= settings.REPORT_MAX_LINES:
+                hidden += 1
+                continue
+            if b.check_in_date.date() == day:
+                movement = "Arriving"
+            elif b.check_out_date.date() == day:
+                movement = "Departing"
+            else:
+                movement = "In-house"
+            report_lines.append(
+                f"• Booking #{b.id}: Room {b.room_number} | Guest {b.name or 'Unknown'} | {movement} "
+                f"({b.check_in_date:%Y-%m-%d} → {b.check_out_date:%Y-%m-%d})"
+            )
+            listed += 1
+
+        if listed == 0:
+            report_lines.append("No arrivals, departures or in-house guests today.")
+        if hidden:
+            report_lines.append(f"... and {hidden} more bookings.")
+        return "\n".join(report_lines)
+
+    def generate_and_send(self):
+        """Generates stats and emails the manager."""
+        db = SessionLocal()
+        started = time.perf_counter()
+        try:
+            # 1. Gather Stats (rows are streamed, only today's movements are listed)
+            final_report = self.build_report(db, datetime.now().date())
 
             # 2. Send Email
             print(f"Generating Daily Report...")
@@ -38,6 +85,8 @@ class ReportService:
             print(f"Daily Report sent to Manager.")
 
         except Exception as e:
+            metrics.JOB_ERRORS.labels("daily_report").inc()
             print(f" Failed to send report: {e}")
         finally:
-            db.close()
\ No newline at end of file
+            db.close()
+            metrics.JOB_SECONDS.labels("daily_report").observe(time.perf_counter() - started)
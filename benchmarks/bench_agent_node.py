@@ -0,0 +1,115 @@
+"""
+Local overhead of the chat agent node, with the LLM call itself made free.
+
+"before" replays the old node body: bind_tools (tool JSON schemas), a new
+SystemMessage, and a filter over the whole history
+on every turn. "after" is the current chatbot_node using the prebuilt role
+profiles, given the history the way the session store hands it over
+(compacted once per turn when it was saved, not on each model call). The
+fake model's bind_tools does the same schema conversion as
+ChatGroq, so the difference is what a real turn saves besides the network.
+
+Usage:
+    python -m benchmarks.bench_agent_node --turns 2000 --history 10 30 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+import app.ai.graph as graph
+from app.ai.roles import ROLE_SPECS
+from app.ai.history import history_manager
+from app.core.config import settings
+
+
+class InstantModel(BaseChatModel):
+    """Answers immediately; bind_tools formats schemas exactly like ChatGroq.bind_tools."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "instant-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return super().bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        return self._generate(messages, stop, run_manager, **kwargs)
+
+
+async def legacy_chatbot_node(state):
+    """The per-turn work chatbot_node did before role profiles."""
+    messages = state.get("messages", [])
+    role = state.get("user_role", "guest")
+    spec = ROLE_SPECS["manager" if role == "manager" else "guest"]
+
+    tools_subset = list(spec.tools)
+    system_prompt = spec.system_prompt
+
+    llm_with_specific_tools = graph.llm.bind_tools(tools_subset)
+    sys_msg = SystemMessage(content=system_prompt)
+
+    history = [m for m in messages if not isinstance(m, SystemMessage)]
+    if len(history) > 30:
+        history = history[-30:]
+
+    response = await llm_with_specific_tools.ainvoke([sys_msg] + history)
+    return {"messages": [response]}
+
+
+def make_history(n: int):
+    msgs = []
+    for i in range(n):
+        msgs.append(HumanMessage(content=f"question {i}") if i % 2 == 0 else AIMessage(content=f"answer {i}"))
+    return msgs
+
+
+async def time_node(node, state, turns: int):
+    for _ in range(20):  # warm-up
+        await node(state)
+    samples = []
+    for _ in range(turns):
+        t0 = time.perf_counter()
+        await node(state)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+async def run(turns: int, history_sizes):
+    graph.set_llm(InstantModel())
+    print(f"{'role':8s} {'history':>7s} {'before p50':>11s} {'after p50':>10s} {'saved':>8s}")
+    for role in ("guest", "manager"):
+        for n in history_sizes:
+            history = make_history(n)
+            state = {"messages": list(history), "user_role": role}
+            if settings.HISTORY_COMPACTION_ENABLED:
+                history = history_manager.compact(history, max_messages=settings.SESSION_MAX_MESSAGES).messages
+            stored = {"messages": history, "user_role": role}
+            before = await time_node(legacy_chatbot_node, state, turns)
+            after = await time_node(graph.chatbot_node, stored, turns)
+            b, a = statistics.median(before), statistics.median(after)
+            print(f"{role:8s} {n:7d} {b:9.1f}µs {a:8.1f}µs {b - a:6.1f}µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--history", type=int, nargs="+", default=[10, 30, 200])
+    args = parser.parse_args()
+    asyncio.run(run(args.turns, args.history))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Availability query benchmark: legacy two-query path vs NOT EXISTS anti-join.
+
+Usage:
+    python -m benchmarks.bench_availability --rooms 200 --bookings 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Settings require a SECRET_KEY; the benchmark never talks to an LLM.
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.session import Base
+from app.db.models import Booking, Room, Guest
+from app.db.repositories.booking_repo import BookingRepository
+
+
+def build_database(path: str, n_rooms: int, n_bookings: int, seed: int = 7):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Room), [
+            {"id": i, "room_number": str(100 + i), "room_type": "Standard", "price": 1400.0,
+             "description": "", "capacity": 2}
+            for i in range(1, n_rooms + 1)
+        ])
+        conn.execute(insert(Guest), [{"id": 1, "name": "Bench", "email": "bench@example.com", "phone": "N/A"}])
+        rows = []
+        for _ in range(n_bookings):
+            start = base + timedelta(days=rng.randrange(0, 730))
+            rows.append({
+                "room_id": rng.randint(1, n_rooms), "guest_id": 1,
+                "check_in_date": start, "check_out_date": start + timedelta(days=rng.randint(1, 7)),
+                "adults": 2, "children": 0, "status": "confirmed",
+            })
+            if len(rows) == 10_000:
+                conn.execute(insert(Booking), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(Booking), rows)
+    return engine
+
+
+def legacy_available_rooms(db, start, end):
+    """The pre-anti-join path: load overlapping bookings, then NOT IN."""
+    overlapping = db.query(Booking).filter(Booking.check_in_date < end, Booking.check_out_date > start).all()
+    booked_ids = [b.room_id for b in overlapping]
+    return db.query(Room).filter(Room.id.notin_(booked_ids)).all()
+
+
+def time_path(fn, db, windows):
+    samples = []
+    for start, end in windows:
+        t0 = time.perf_counter()
+        fn(db, start, end)
+        samples.append((time.perf_counter() - t0) * 1000)
+        db.expunge_all()
+    return statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--bookings", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    windows = []
+    for _ in range(args.queries):
+        start = datetime(2025, 1, 1) + timedelta(days=rng.randrange(0, 730))
+        windows.append((start, start + timedelta(days=rng.randint(1, 14))))
+
+    print(f"{'bookings':>10} | {'legacy p50 ms':>13} | {'legacy max':>10} | {'anti-join p50 ms':>16} | {'anti-join max':>13}")
+    print("-" * 75)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.bookings:
+            engine = build_database(os.path.join(tmp, f"bench_{n}.db"), args.rooms, n)
+            db = sessionmaker(bind=engine)()
+            try:
+                repo = BookingRepository(db)
+                # Both paths must agree before we compare their speed
+                for start, end in windows[:5]:
+                    legacy = {r.id for r in legacy_available_rooms(db, start, end)}
+                    current = {r.id for r in repo.get_available_rooms(start, end)}
+                    assert legacy == current, "anti-join result differs from legacy path"
+
+                legacy_p50, legacy_max = time_path(legacy_available_rooms, db, windows)
+                new_p50, new_max = time_path(lambda s, a, b: repo.get_available_rooms(a, b), db, windows)
+                print(f"{n:>10,} | {legacy_p50:>13.2f} | {legacy_max:>10.2f} | {new_p50:>16.2f} | {new_max:>13.2f}")
+            finally:
+                db.close()
+                engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Shows concurrent /chat requests overlapping on one event loop.
+
+The LLM is the offline ScriptedChatModel, which waits `--latency` seconds (like a slow
+Groq round trip) without blocking. If the chat path blocked the loop, N
+requests would take ~N x latency; overlapping, they take ~1 x latency.
+
+Usage:
+    python -m benchmarks.bench_chat_concurrency --requests 20 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+
+import httpx
+from fastapi import FastAPI
+
+import app.ai.graph as graph
+from app.ai.llm import ScriptedChatModel
+from app.api.v1.routers import chat
+
+
+async def run(n_requests: int, latency: float):
+    graph.set_llm(ScriptedChatModel(latency_seconds=latency, script=["Certainly."]))
+    api = FastAPI()
+    api.include_router(chat.router)
+
+    transport = httpx.ASGITransport(app=api)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        t0 = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/chat", json={"message": f"Hello #{i}", "role": "guest"}) for i in range(n_requests)
+        ])
+        elapsed = time.perf_counter() - t0
+
+    assert all(r.status_code == 200 for r in responses), [r.text for r in responses if r.status_code != 200]
+    serial = n_requests * latency
+    print(f"{n_requests} requests x {latency:.2f}s model latency")
+    print(f"  wall time:         {elapsed:.2f}s")
+    print(f"  if run serially:   {serial:.2f}s")
+    print(f"  overlap factor:    {serial / elapsed:.1f}x")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    elapsed = asyncio.run(run(args.requests, args.latency))
+    # Overlapping requests finish in a small multiple of one model call
+    if elapsed > args.latency * max(2, args.requests / 4):
+        raise SystemExit("FAIL: /chat requests did not overlap")
+    print("OK: /chat requests overlapped")
+
+
+if __name__ == "__main__":
+    main()
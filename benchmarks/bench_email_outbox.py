@@ -0,0 +1,100 @@
+"""
+Email delivery benchmark against a local SMTP sink (aiosmtpd).
+
+Compares the old path (EmailService._send: new connection per message) with
+the outbox worker (one pooled SMTPConnection, batched claims). Add
+`--latency` to simulate a slow mail server's connect handshake.
+
+Usage:
+    python -m benchmarks.bench_email_outbox --messages 200 --latency 0.05
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+# Settings are read at import: point the app at a throwaway DB and the local sink.
+_TMP = tempfile.mkdtemp(prefix="outbox-bench-")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP, 'outbox.db')}"
+os.environ["EMAIL_SENDER"] = "hotel@example.com"
+os.environ["SMTP_SERVER"] = "127.0.0.1"
+os.environ["SMTP_PORT"] = "8025"
+os.environ["SMTP_STARTTLS"] = "false"
+os.environ["SMTP_REQUIRE_AUTH"] = "false"
+
+from aiosmtpd.controller import Controller
+
+from app.db.session import engine, SessionLocal
+from app.db.migrations import run_migrations
+from app.db.repositories.outbox_repo import outbox_message
+from app.services.email_service import EmailService
+from app.services.email_worker import EmailWorker
+
+
+class Sink:
+    """Counts delivered messages; waits `latency` on connect like a remote server's greeting."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.messages = 0
+        self.connections = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        await asyncio.sleep(self.latency)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 Message accepted for delivery"
+
+
+def bench_per_message(n: int) -> float:
+    emailer = EmailService()
+    started = time.perf_counter()
+    for i in range(n):
+        emailer._send(f"guest{i}@example.com", "Booking Confirmed", "See you soon!")
+    return time.perf_counter() - started
+
+
+def bench_outbox(n: int) -> float:
+    db = SessionLocal()
+    db.add_all([outbox_message(f"guest{i}@example.com", "Booking Confirmed", "See you soon!") for i in range(n)])
+    db.commit()
+    db.close()
+
+    worker = EmailWorker()
+    started = time.perf_counter()
+    while worker.drain_once():
+        pass
+    elapsed = time.perf_counter() - started
+    worker.connection.close()
+    return elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--messages", type=int, default=200)
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds added to each SMTP handshake")
+    args = ap.parse_args()
+
+    run_migrations(engine)
+    sink = Sink(args.latency)
+    controller = Controller(sink, hostname="127.0.0.1", port=8025)
+    controller.start()
+    try:
+        for label, fn in (("per-message connection", bench_per_message), ("outbox worker (pooled)", bench_outbox)):
+            sink.messages = sink.connections = 0
+            elapsed = fn(args.messages)
+            print(f"{label:24s} {elapsed:7.3f}s  {args.messages / elapsed:8.1f} msg/s  "
+                  f"delivered={sink.messages} connections={sink.connections}")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
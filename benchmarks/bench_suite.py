@@ -0,0 +1,283 @@
+"""
+Scale benchmark for the booking / availability hot paths.
+
+Builds a synthetic hotel for every ROOMSxBOOKINGS size, times each
+operation and reports p50 / p95 / p99 in ms. Results go to a JSON file so
+runs can be compared; `--compare` fails (exit 1) when an operation's p95
+got slower than `--threshold` x the baseline.
+
+Usage:
+    python -m benchmarks.bench_suite --sizes 50x10000 1000x100000 --output bench.json
+    python -m benchmarks.bench_suite --sizes 50x10000 --compare bench.json
+    python -m benchmarks.bench_suite --sizes 10000x5000000 --db-dir /data/bench  # keep the big DBs
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Settings are read at import. Availability answers are not cached here, so the query path is what's timed.
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ.setdefault("AVAILABILITY_CACHE_ENABLED", "false")
+
+import sqlalchemy
+
+from app.db.session import Base, SessionLocal, build_engine
+from app.db.models import Booking
+from app.db.bulk_import import BulkImporter, print_reports, synthetic_hotel
+from app.db.migrations import run_migrations
+from app.db.repositories.booking_repo import BookingRepository
+from app.services.booking_service import BookingService
+from app.services.report_service import ReportService
+from app.ai.tools.stats import hotel_stats_tool
+from app.ai.tools.reporting import get_booking_details_tool
+
+
+# ============================================================
+# DATA GENERATION
+# ============================================================
+# op_book_room writes its stays from here on, so a reused DB can drop them again
+BENCH_WRITES_FROM = datetime(2200, 1, 1)
+
+
+def open_database(path: str, n_rooms: int, n_bookings: int):
+    """
+    Reuses the DB at `path` if it was generated at this size, else builds it.
+    The size is read from a marker file written after a complete build (live
+    row counts change as op_book_room adds bookings). Returns (engine, build seconds).
+    """
+    engine = build_engine(f"sqlite:///{path}")
+    run_migrations(engine)
+    marker = path + ".meta.json"
+    generated = {"rooms": n_rooms, "bookings": n_bookings}
+    try:
+        with open(marker) as f:
+            reusable = json.load(f) == generated
+    except (OSError, ValueError):
+        reusable = False
+    if reusable:
+        with engine.begin() as conn:
+            # Earlier runs' writes go, so every run times the same data
+            conn.execute(sqlalchemy.delete(Booking).where(Booking.check_in_date >= BENCH_WRITES_FROM))
+        return engine, 0.0
+
+    if os.path.exists(marker):
+        os.remove(marker)
+    Base.metadata.drop_all(bind=engine)
+    run_migrations(engine)
+    t0 = time.perf_counter()
+    print_reports(BulkImporter(engine).load_all(synthetic_hotel(n_rooms, n_bookings)))
+    with open(marker, "w") as f:
+        json.dump(generated, f)
+    return engine, time.perf_counter() - t0
+
+
+# ============================================================
+# OPERATIONS
+# ============================================================
+def random_window(rng, max_nights=14):
+    start = datetime.now().date() + timedelta(days=rng.randint(1, 365))
+    return start, start + timedelta(days=rng.randint(1, max_nights))
+
+
+def op_get_available_rooms(rng, n_rooms):
+    start, end = random_window(rng)
+    db = SessionLocal()
+    try:
+        BookingRepository(db).get_available_rooms(datetime.combine(start, datetime.min.time()),
+                                                  datetime.combine(end, datetime.min.time()))
+    finally:
+        db.close()
+
+
+def op_check_availability(rng, n_rooms):
+    start, end = random_window(rng)
+    db = SessionLocal()
+    try:
+        BookingService(db).check_availability(start.isoformat(), end.isoformat())
+    finally:
+        db.close()
+
+
+def op_book_room(rng, n_rooms):
+    # Far-future stays so every booking succeeds and the measured path includes the write
+    start = BENCH_WRITES_FROM + timedelta(days=rng.randint(0, 200_000))
+    end = start + timedelta(days=rng.randint(1, 5))
+    db = SessionLocal()
+    try:
+        result = BookingService(db).book_room(str(100 + rng.randint(1, n_rooms)), "Bench Guest",
+                                              f"bench{rng.randint(1, 10**9)}@example.com",
+                                              start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+    finally:
+        db.close()
+    assert result.startswith("Success") or "already booked" in result, result
+
+
+def op_hotel_stats(rng, n_rooms):
+    hotel_stats_tool.invoke({})
+
+
+def op_booking_details(rng, n_rooms):
+    get_booking_details_tool.invoke({"room_number": str(100 + rng.randint(1, n_rooms))})
+
+
+def op_booking_details_all(rng, n_rooms):
+    get_booking_details_tool.invoke({})
+
+
+def op_daily_report(rng, n_rooms):
+    # The mock mailer prints the report; keep it off the console
+    with contextlib.redirect_stdout(io.StringIO()):
+        ReportService().generate_and_send()
+
+
+OPERATIONS = {
+    "get_available_rooms": op_get_available_rooms,
+    "check_availability": op_check_availability,
+    "book_room": op_book_room,
+    "hotel_stats_tool": op_hotel_stats,
+    "get_booking_details_tool[room]": op_booking_details,
+    "get_booking_details_tool[all]": op_booking_details_all,
+    "report.generate_and_send": op_daily_report,
+}
+
+
+def percentiles(samples_ms):
+    if len(samples_ms) < 2:
+        v = samples_ms[0] if samples_ms else 0.0
+        return {"p50_ms": v, "p95_ms": v, "p99_ms": v, "mean_ms": v}
+    q = statistics.quantiles(samples_ms, n=100, method="inclusive")
+    return {
+        "p50_ms": round(q[49], 3),
+        "p95_ms": round(q[94], 3),
+        "p99_ms": round(q[98], 3),
+        "mean_ms": round(statistics.fmean(samples_ms), 3),
+    }
+
+
+def time_operation(fn, n_rooms, iterations, max_seconds, seed):
+    """Runs `fn` up to `iterations` times (at least 5, at most ~max_seconds of work)."""
+    rng = random.Random(seed)
+    fn(rng, n_rooms)  # warm-up: first-use imports, connection, SQLite page cache
+    samples = []
+    spent = 0.0
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        fn(rng, n_rooms)
+        elapsed = time.perf_counter() - t0
+        samples.append(elapsed * 1000)
+        spent += elapsed
+        if spent > max_seconds and i >= 4:
+            break
+    return {"iterations": len(samples), **percentiles(samples)}
+
+
+# ============================================================
+# RUN / COMPARE
+# ============================================================
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_scenario(db_dir, n_rooms, n_bookings, ops, iterations, max_seconds):
+    path = os.path.join(db_dir, f"bench_{n_rooms}x{n_bookings}.db")
+    engine, build_seconds = open_database(path, n_rooms, n_bookings)
+    SessionLocal.configure(bind=engine)  # every service / tool opens its sessions through SessionLocal
+    print(f"\n🏨 {n_rooms:,} rooms x {n_bookings:,} bookings" + (f" (built in {build_seconds:.1f}s)" if build_seconds else ""))
+    print(f"  {'operation':32s} {'n':>4s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s}")
+
+    results = {}
+    try:
+        for i, name in enumerate(ops):
+            r = time_operation(OPERATIONS[name], n_rooms, iterations, max_seconds, seed=1000 + i)
+            results[name] = r
+            print(f"  {name:32s} {r['iterations']:>4d} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}")
+    finally:
+        engine.dispose()
+    return {"rooms": n_rooms, "bookings": n_bookings, "build_seconds": round(build_seconds, 2), "results": results}
+
+
+def compare(report, baseline_path, threshold):
+    """Prints p95 ratios against a previous run; returns the list of regressions."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    old = {(s["rooms"], s["bookings"]): s["results"] for s in baseline.get("scenarios", [])}
+    regressions = []
+    print(f"\n📊 Against {baseline_path} (commit {baseline.get('meta', {}).get('git_commit')}), p95:")
+    for s in report["scenarios"]:
+        before = old.get((s["rooms"], s["bookings"]))
+        if not before:
+            continue
+        for name, r in s["results"].items():
+            if name not in before or not before[name]["p95_ms"]:
+                continue
+            ratio = r["p95_ms"] / before[name]["p95_ms"]
+            flag = "❌ REGRESSION" if ratio > threshold else ""
+            print(f"  {s['rooms']}x{s['bookings']} {name:32s} {before[name]['p95_ms']:>9.2f} → {r['p95_ms']:>9.2f} "
+                  f"({ratio:.2f}x) {flag}")
+            if flag:
+                regressions.append({"scenario": f"{s['rooms']}x{s['bookings']}", "operation": name, "ratio": ratio})
+    return regressions
+
+
+def parse_size(text: str):
+    rooms, bookings = text.lower().split("x")
+    return int(rooms), int(bookings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["50x10000", "500x100000"], help="ROOMSxBOOKINGS")
+    parser.add_argument("--ops", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS))
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--max-seconds", type=float, default=20.0, help="time budget per operation")
+    parser.add_argument("--db-dir", help="keep generated databases here and reuse them (default: temp dir)")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="p95 ratio counted as a regression")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+        },
+        "scenarios": [],
+    }
+
+    with contextlib.ExitStack() as stack:
+        db_dir = args.db_dir or stack.enter_context(tempfile.TemporaryDirectory(prefix="hotel-bench-"))
+        os.makedirs(db_dir, exist_ok=True)
+        for size in args.sizes:
+            n_rooms, n_bookings = parse_size(size)
+            report["scenarios"].append(
+                run_scenario(db_dir, n_rooms, n_bookings, args.ops, args.iterations, args.max_seconds))
+
+    regressions = compare(report, args.compare, args.threshold) if args.compare else []
+    report["regressions"] = regressions
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+    if regressions:
+        raise SystemExit(f"FAIL: {len(regressions)} operation(s) regressed more than {args.threshold}x")
+
+
+if __name__ == "__main__":
+    main()
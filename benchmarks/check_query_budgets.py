@@ -0,0 +1,138 @@
+"""
+Query-count budgets for the endpoints and tools (N+1 regression check).
+
+Builds a small synthetic hotel, runs each operation once to warm up, then
+again under the query profiler and fails (exit 1) if any one goes over its
+budget or repeats a statement shape more than QUERY_PROFILER_REPEAT_THRESHOLD
+times. Endpoints are counted via the X-Query-Count header the profiler
+middleware adds; tools and services via profiler.assert_max_queries.
+
+Budgets are per call and must not grow with the data: run with a bigger
+`--bookings` to check that.
+
+Usage:
+    python -m benchmarks.check_query_budgets
+    python -m benchmarks.check_query_budgets --rooms 200 --bookings 200000
+"""
+import argparse
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+# Settings are read at import: profiler on, a throwaway DB, no LLM, no caches hiding the queries.
+_TMP = tempfile.mkdtemp(prefix="query-budgets-")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP, 'budgets.db')}"
+os.environ["QUERY_PROFILER_ENABLED"] = "true"
+os.environ["AVAILABILITY_CACHE_ENABLED"] = "false"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["MANAGER_API_KEY"] = "benchmark-manager"
+MANAGER = {"X-Manager-Key": "benchmark-manager"}
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db import profiler
+from app.db.session import engine, SessionLocal
+from app.db.bulk_import import BulkImporter, synthetic_hotel
+from app.services.report_service import ReportService
+from app.ai.tools.stats import hotel_stats_tool
+from app.ai.tools.reporting import get_booking_details_tool
+from app.ai.tools.analytics import hotel_analytics_tool
+
+
+def day(offset: int) -> str:
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+# name -> (max queries, request kwargs for TestClient)
+ENDPOINT_BUDGETS = {
+    "POST /book": (6, dict(method="POST", url="/book", json={
+        "room_number": "101", "name": "Budget", "email": "budget@example.com",
+        "start_date": day(4000), "end_date": day(4002)})),
+    "POST /bookings/batch": (6, dict(method="POST", url="/bookings/batch", json={
+        "name": "Group", "email": "group@example.com", "start_date": day(4100), "end_date": day(4103),
+        "rooms": [{"room_number": str(100 + i)} for i in range(1, 21)]})),
+    "GET /analytics/occupancy": (2, dict(method="GET", url="/analytics/occupancy", headers=MANAGER,
+                                         params={"start_date": day(-30), "end_date": day(0)})),
+    "GET /bookings": (1, dict(method="GET", url="/bookings", headers=MANAGER, params={"limit": 50})),
+    "GET /bookings (room type, dates)": (1, dict(method="GET", url="/bookings", headers=MANAGER, params={
+        "room_type": "Deluxe King", "start_date": day(0), "end_date": day(30)})),
+    "POST /chat (fast path: availability)": (1, dict(method="POST", url="/chat", json={
+        "message": f"rooms from {day(10)} to {day(12)}", "role": "guest"})),
+    "POST /chat (fast path: stats)": (1, dict(method="POST", url="/chat", json={
+        "message": "occupancy today", "role": "manager"})),
+}
+
+# name -> (max queries, callable)
+CALL_BUDGETS = {
+    "hotel_stats_tool": (1, lambda: hotel_stats_tool.invoke({})),
+    "hotel_analytics_tool": (2, lambda: hotel_analytics_tool.invoke({"start_date": day(-7), "end_date": day(0)})),
+    "get_booking_details_tool[room]": (1, lambda: get_booking_details_tool.invoke({"room_number": "101"})),
+    "get_booking_details_tool[all]": (1, lambda: get_booking_details_tool.invoke({})),
+    "ReportService.build_report": (3, lambda: _with_db(lambda db: ReportService().build_report(db, date.today()))),
+}
+
+
+def _with_db(fn):
+    db = SessionLocal()
+    try:
+        return fn(db)
+    finally:
+        db.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rooms", type=int, default=50)
+    ap.add_argument("--bookings", type=int, default=5000)
+    args = ap.parse_args()
+
+    BulkImporter(engine).load_all(synthetic_hotel(args.rooms, args.bookings))
+    from app.api.main import app  # after the data exists (startup loads indexes / queues a report)
+
+    repeats = settings.QUERY_PROFILER_REPEAT_THRESHOLD
+    failures = []
+    print(f"\n🧾 Query budgets ({args.rooms} rooms x {args.bookings:,} bookings)")
+    print(f"  {'operation':40s} {'queries':>7s} {'budget':>6s}")
+
+    with TestClient(app) as client:
+        for name, (budget, request) in ENDPOINT_BUDGETS.items():
+            client.request(**request)  # warm-up (pool connection, availability index, ...)
+            if request["method"] == "POST" and "book" in request["url"]:
+                request = _next_dates(request)
+            response = client.request(**request)
+            count = int(response.headers.get("X-Query-Count", -1))
+            ok = response.status_code < 400 and 0 <= count <= budget
+            print(f"  {'✅' if ok else '❌'} {name:38s} {count:7d} {budget:6d}")
+            if not ok:
+                failures.append(f"{name}: {count} queries (budget {budget}), HTTP {response.status_code}")
+
+    for name, (budget, fn) in CALL_BUDGETS.items():
+        fn()  # warm-up
+        try:
+            with profiler.assert_max_queries(budget, name, max_repeats=repeats) as unit:
+                fn()
+            print(f"  ✅ {name:38s} {unit.count:7d} {budget:6d}")
+        except AssertionError as e:
+            print(f"  ❌ {name:38s} {'-':>7s} {budget:6d}")
+            failures.append(str(e))
+
+    if failures:
+        print("\n❌ Over budget:\n" + "\n".join(failures))
+        sys.exit(1)
+    print("\n✅ All operations within their query budgets.")
+
+
+def _next_dates(request: dict) -> dict:
+    """Same booking request a week later, so the measured call is a fresh (successful) booking."""
+    body = dict(request["json"])
+    body["start_date"] = (date.fromisoformat(body["start_date"]) + timedelta(days=7)).isoformat()
+    body["end_date"] = (date.fromisoformat(body["end_date"]) + timedelta(days=7)).isoformat()
+    return dict(request, json=body)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-DATABASE_URL = "sqlite:///./hotel.db"
-engine = create_engine(
-        DATABASE_URL, connect_args={"check_same_thread": False},echo=True
-)
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+# Legacy entry point: the application engine lives in app/db/session.py.
+# Nothing is created at import; `engine` / `SessionLocal` resolve to the shared ones on first use.
+
+
+def __getattr__(name):
+    if name in ("engine", "SessionLocal"):
+        from app.db import session
+        return getattr(session, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db():
+    from app.db.session import SessionLocal
+
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,7 +1,9 @@
 import streamlit as st
 import requests
+import json
 import os
 import time
+import uuid
 from datetime import datetime, timedelta
 from auth import authenticate_user
 
@@ -32,7 +34,9 @@ if "authenticated" not in st.session_state:
         "extracted_start": None,
         "extracted_end": None,
         "extracted_adults": 1,
-        "extracted_children": 0
+        "extracted_children": 0,
+        # Server-side conversation key (one per browser session)
+        "chat_session_id": uuid.uuid4().hex
     })
 
 # --- CSS STYLING ---
@@ -70,6 +74,43 @@ def render_room_cards(bot_response):
                     st.toast(f"Room {room_number} selected!", icon="🛎️")
 
 
+TOOL_LABELS = {
+    "check_availability_tool": "🔎 Checking availability...",
+    "book_room_tool": "🛎️ Placing your reservation...",
+    "get_guest_info_tool": "📇 Looking up the guest...",
+    "hotel_stats_tool": "📊 Gathering hotel stats...",
+    "get_booking_details_tool": "📅 Pulling bookings...",
+    "hotel_analytics_tool": "📈 Crunching occupancy and revenue...",
+}
+
+
+def stream_chat(prompt, role, status, result):
+    """Yields reply tokens from /chat/stream (SSE); stores the final reply or error in `result`."""
+    with requests.post(f"{API_URL}/chat/stream", json={"message": prompt, "role": role, "session_id": st.session_state.chat_session_id},
+                       stream=True, timeout=(5, 120)) as res:
+        res.raise_for_status()
+        event = None
+        for line in res.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            if line.startswith("event:"):
+                event = line[len("event:"):].strip()
+                continue
+            if not line.startswith("data:"):
+                continue
+            data = json.loads(line[len("data:"):])
+            if event == "token":
+                yield data["content"]
+            elif event == "tool_start":
+                status.caption(TOOL_LABELS.get(data["name"], "⏳ Working on it..."))
+            elif event == "tool_end":
+                status.empty()
+            elif event == "done":
+                result["response"] = data["response"]
+            elif event == "error":
+                result["error"] = data["detail"]
+
+
 # --- MAIN LOGIC ---
 if st.session_state.entering:
     with st.container():
@@ -153,6 +194,7 @@ else:
                             st.rerun()
         if st.button("Logout"):
             st.session_state.authenticated = False
+            st.session_state.chat_session_id = uuid.uuid4().hex
             st.rerun()
 
     role = st.session_state.user_role
@@ -168,17 +210,22 @@ else:
         st.session_state[msg_key].append({"role": "user", "content": prompt})
         with st.chat_message("user"):
             st.write(prompt)
-        with st.spinner("Concierge is attending to your request..."):
+        with st.chat_message("assistant"):
+            status = st.empty()
+            result = {}
             try:
-                res = requests.post(f"{API_URL}/chat", json={"message": prompt, "role": role}, timeout=10)
-                data = res.json()
-                reply = data.get("response", "Error.")
+                # Render tokens as they arrive; tool activity shows as a caption above the reply
+                streamed = st.write_stream(stream_chat(prompt, role, status, result))
+                status.empty()
+                if "error" in result:
+                    raise RuntimeError(result["error"])
+                reply = result.get("response", streamed if isinstance(streamed, str) else "Error.")
 
                 # Check for form trigger and extract metadata
                 if "<SHOW_BOOKING_FORM>" in reply:
                     st.session_state.booking_mode = True
                     # Capture extracted data from the backend response
-                    extracted = data.get("extracted_data", {})
+                    extracted = result.get("extracted_data", {})
                     st.session_state.extracted_start = extracted.get("start_date")
                     st.session_state.extracted_end = extracted.get("end_date")
                     st.session_state.extracted_adults = extracted.get("adults", 1)
@@ -188,5 +235,7 @@ else:
 
                 st.session_state[msg_key].append({"role": "assistant", "content": reply})
                 st.rerun()
+            except RuntimeError as e:
+                st.error(str(e))
             except Exception:
-                st.error("Server connection timeout. Ensure the backend is running on port 8001.")
\ No newline at end of file
+                st.error("Server connection timeout. Ensure the backend is running on port 8001.")
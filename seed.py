@@ -1,3 +1,4 @@
+import argparse
 import logging
 import sys
 import hashlib
@@ -8,6 +9,7 @@ from app.db.session import engine, SessionLocal
 from app.db.models import Base, Room, User
 from sqlalchemy.exc import SQLAlchemyError
 from app.core.security import get_password_hash
+from app.db.bulk_import import BulkImporter, CHUNK_SIZE, directory_sources, print_reports, synthetic_hotel
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -86,13 +88,39 @@ def seed_rooms(db):
     logger.info(f"✅ Seeded {len(rooms_to_add)} rooms.")
 
 
+def bulk_seed(args):
+    """Loads rooms/guests/bookings from files (--import-dir) or the synthetic generator (--bookings N)."""
+    if args.import_dir:
+        logger.info(f"📂 Importing from {args.import_dir}...")
+        sources = directory_sources(args.import_dir)
+    else:
+        logger.info(f"🏭 Generating {args.rooms} rooms / {args.bookings} bookings...")
+        sources = synthetic_hotel(args.rooms, args.bookings, n_guests=args.guests, seed=args.seed)
+    print_reports(BulkImporter(engine, chunk_size=args.chunk_size).load_all(sources))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Reset and seed the hotel database.")
+    parser.add_argument("--import-dir", help="directory with rooms/guests/bookings .csv or .parquet files")
+    parser.add_argument("--bookings", type=int, default=0, help="generate this many synthetic bookings")
+    parser.add_argument("--rooms", type=int, default=500, help="rooms for the synthetic hotel")
+    parser.add_argument("--guests", type=int, default=None, help="guests for the synthetic hotel (default bookings/5)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     if not reset_database():
         sys.exit(1)
 
     db = SessionLocal()
     try:
-        seed_rooms(db)
+        if args.import_dir or args.bookings:
+            bulk_seed(args)
+        else:
+            seed_rooms(db)
         seed_users(db)
         logger.info("🚀 Database Ready! Login with 'manager' / 'admin123'")
     except Exception as e: